@@ -0,0 +1,200 @@
+import numpy as np
+from Logic.bitboard import BitBoard
+
+
+ROWS = BitBoard.ROWS
+COLS = BitBoard.COLS
+CELLS = ROWS * COLS
+CENTER_WEIGHTS = np.array([COLS // 2 + 1 - abs(COLS // 2 - c) for c in range(COLS)], dtype=np.float64)
+
+
+def four_in_a_row(cells):
+    """
+    Checks a batch of boards for four aligned cells, using the same windows as Board.winning_move.
+
+    Parameters:
+    - cells: A boolean array of shape (N, ROWS, COLS) marking one player's pieces.
+
+    Returns:
+    - A boolean array of shape (N,) that is True where the player has four in a row.
+    """
+    horizontal = cells[:, :, :-3] & cells[:, :, 1:-2] & cells[:, :, 2:-1] & cells[:, :, 3:]
+    vertical = cells[:, :-3, :] & cells[:, 1:-2, :] & cells[:, 2:-1, :] & cells[:, 3:, :]
+    diagonal = cells[:, :-3, :-3] & cells[:, 1:-2, 1:-2] & cells[:, 2:-1, 2:-1] & cells[:, 3:, 3:]
+    anti_diagonal = cells[:, 3:, :-3] & cells[:, 2:-1, 1:-2] & cells[:, 1:-2, 2:-1] & cells[:, :-3, 3:]
+    return horizontal.any(axis=(1, 2)) | vertical.any(axis=(1, 2)) | \
+        diagonal.any(axis=(1, 2)) | anti_diagonal.any(axis=(1, 2))
+
+
+def random_policy(sim, games):
+    """
+    Picks a random open column.
+
+    Parameters:
+    - sim: The BatchSimulator to pick moves for.
+    - games: The indices of the games to pick a move in.
+
+    Returns:
+    - An int array holding one column per game in games.
+    """
+    scores = sim.rng.random((len(games), COLS))
+    scores[sim.heights[games] >= ROWS] = -1.0
+    return scores.argmax(axis=1)
+
+
+def winning_columns(sim, games, pieces):
+    """
+    Finds, for every game and column, whether dropping a piece there makes four in a row.
+
+    Parameters:
+    - sim: The BatchSimulator to check.
+    - games: The indices of the games to check.
+    - pieces: An int array with the piece (1 or 2) to drop in each game of games.
+
+    Returns:
+    - A boolean array of shape (len(games), COLS).
+    """
+    index = np.arange(len(games))
+    heights = sim.heights[games]
+    owned = sim.boards[games] == pieces[:, None, None]
+    wins = np.zeros((len(games), COLS), dtype=bool)
+    for col in range(COLS):
+        open_games = heights[:, col] < ROWS
+        rows = ROWS - 1 - np.minimum(heights[:, col], ROWS - 1)
+        trial = owned.copy()
+        trial[index, rows, col] |= open_games
+        wins[:, col] = four_in_a_row(trial) & open_games
+    return wins
+
+
+def heuristic_policy(sim, games):
+    """
+    Wins when possible, otherwise blocks the opponent's immediate win, otherwise
+    picks a random open column weighted towards the center.
+
+    Parameters:
+    - sim: The BatchSimulator to pick moves for.
+    - games: The indices of the games to pick a move in.
+
+    Returns:
+    - An int array holding one column per game in games.
+    """
+    pieces = sim.current_pieces()[games]
+    scores = sim.rng.random((len(games), COLS)) * CENTER_WEIGHTS
+    scores += winning_columns(sim, games, 3 - pieces) * 100.0
+    scores += winning_columns(sim, games, pieces) * 1000.0
+    scores[sim.heights[games] >= ROWS] = -1.0
+    return scores.argmax(axis=1)
+
+
+def player_policy(player):
+    """
+    Wraps a computer player with a choose_move(board) method, such as NegamaxAI
+    or MCTSAI, as a batch policy. Each game is searched one at a time.
+
+    Parameters:
+    - player: The computer player.
+
+    Returns:
+    - A policy function.
+    """
+    def policy(sim, games):
+        return np.array([player.choose_move(BitBoard.from_moves(sim.history[game, :sim.moves[game]].tolist()))
+                         for game in games.tolist()], dtype=np.int64)
+    return policy
+
+
+class BatchSimulator:
+    """
+    Class that plays many headless games of Connect Four at once.
+
+    The boards are held in one (N, ROWS, COLS) array, with row 0 at the top as
+    in Board. Every step plays one move in every game. When a game ends, its
+    result is reported and the slot starts a new game.
+    """
+
+    def __init__(self, n_games=1024, policies=(random_policy, random_policy), seed=None):
+        """
+        Initializes the simulator with empty boards.
+
+        Parameters:
+        - n_games: The number of games played side by side.
+        - policies: The policy functions for player 1 and player 2. A policy takes the
+          simulator and an array of game indices, and returns one open column per game.
+        - seed: The seed of the random number generator (optional).
+        """
+        self.n_games = n_games
+        self.policies = policies
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.zeros((n_games, ROWS, COLS), dtype=np.int8)
+        self.heights = np.zeros((n_games, COLS), dtype=np.int8)
+        self.moves = np.zeros(n_games, dtype=np.int64)
+        self.history = np.zeros((n_games, CELLS), dtype=np.int8)
+
+    def current_pieces(self):
+        """
+        Returns:
+        - An int array of shape (N,) with the piece (1 or 2) to move in each game.
+        """
+        return self.moves % 2 + 1
+
+    def step(self):
+        """
+        Plays one move in every game.
+
+        Returns:
+        - A (finished, winners) tuple: the indices of the games that ended, and for
+          each of them the winning piece (1 or 2), or 0 for a draw.
+        """
+        pieces = self.current_pieces()
+        columns = np.empty(self.n_games, dtype=np.int64)
+        for piece, policy in ((1, self.policies[0]), (2, self.policies[1])):
+            games = np.flatnonzero(pieces == piece)
+            if len(games):
+                columns[games] = policy(self, games)
+
+        index = np.arange(self.n_games)
+        rows = ROWS - 1 - self.heights[index, columns]
+        self.boards[index, rows, columns] = pieces
+        self.heights[index, columns] += 1
+        self.history[index, self.moves] = columns
+        self.moves += 1
+
+        won = four_in_a_row(self.boards == pieces[:, None, None])
+        finished = np.flatnonzero(won | (self.moves == CELLS))
+        winners = np.where(won[finished], pieces[finished], 0)
+        return finished, winners
+
+    def reset(self, games):
+        """
+        Clears the given games so they start over.
+
+        Parameters:
+        - games: The indices of the games to clear.
+        """
+        self.boards[games] = 0
+        self.heights[games] = 0
+        self.moves[games] = 0
+
+    def run(self, total_games):
+        """
+        Plays games until total_games have finished. Games still in progress at
+        that point are dropped.
+
+        Parameters:
+        - total_games: The number of games to play.
+
+        Yields:
+        - A (winner, moves) tuple for every finished game, where winner is 1, 2 or 0
+          for a draw and moves is the list of columns played.
+        """
+        self.reset(np.arange(self.n_games))
+        done = 0
+        while done < total_games:
+            finished, winners = self.step()
+            for game, winner in zip(finished.tolist(), winners.tolist()):
+                if done == total_games:
+                    break
+                yield winner, self.history[game, :self.moves[game]].tolist()
+                done += 1
+            self.reset(finished)
@@ -0,0 +1,231 @@
+class BitBoard:
+    """
+    Class that handles the board logic for Connect Four using bitboards.
+
+    Each player's pieces are stored as a single integer. Every column uses
+    ROWS + 1 bits, bottom cell first, with one spare bit on top so that shifts
+    never carry a line from one column into the next. The public API matches
+    Board, with row 0 being the top row of the board.
+    """
+    ROWS = 6
+    COLS = 7
+    HEIGHT = ROWS + 1
+    BOTTOM_MASK = int(("0" * ROWS + "1") * COLS, 2)
+    BOARD_MASK = BOTTOM_MASK * ((1 << ROWS) - 1)
+
+    def __init__(self):
+        """
+        Initializes an empty board.
+        """
+        self.pieces = [0, 0]
+        self.heights = [0] * self.COLS
+        self.moves = []
+
+    @classmethod
+    def from_moves(cls, moves):
+        """
+        Builds a board by playing a sequence of columns from the empty position.
+
+        Parameters:
+        - moves: The columns played so far, first move first.
+
+        Returns:
+        - A new BitBoard holding the resulting position.
+        """
+        board = cls()
+        for col in moves:
+            board.play(col)
+        return board
+
+    @property
+    def mask(self):
+        """
+        Returns:
+        - A bitboard with every occupied cell set.
+        """
+        return self.pieces[0] | self.pieces[1]
+
+    @property
+    def board(self):
+        """
+        Builds a list of lists view of the board, in the same layout as Board.board.
+
+        Returns:
+        - A ROWS x COLS list of lists holding 0, 1 or 2 for every cell.
+        """
+        grid = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        for piece in (1, 2):
+            bits = self.pieces[piece - 1]
+            for c in range(self.COLS):
+                for h in range(self.ROWS):
+                    if bits >> (c * self.HEIGHT + h) & 1:
+                        grid[self.ROWS - 1 - h][c] = piece
+        return grid
+
+    def key(self):
+        """
+        Returns:
+        - An integer that uniquely identifies the position and the player to move.
+        """
+        return self.pieces[len(self.moves) & 1] + self.pieces[0] + self.pieces[1]
+
+    def _bit(self, row, col):
+        """
+        Returns the bit for the given cell.
+
+        Parameters:
+        - row: The row of the cell, 0 being the top row.
+        - col: The column of the cell.
+        """
+        return 1 << (col * self.HEIGHT + self.ROWS - 1 - row)
+
+    def drop_piece(self, row, col, piece):
+        """
+        Drops a piece into the board at the specified location.
+
+        Parameters:
+        - row: The row where the piece will be placed.
+        - col: The column where the piece will be placed.
+        - piece: The player's piece (1 or 2) to be placed.
+        """
+        self.pieces[piece - 1] |= self._bit(row, col)
+        self.heights[col] = max(self.heights[col], self.ROWS - row)
+        self.moves.append(col)
+
+    def current_piece(self):
+        """
+        Returns:
+        - The piece (1 or 2) of the player whose turn it is.
+        """
+        return len(self.moves) % 2 + 1
+
+    def play(self, col):
+        """
+        Plays the current player's piece in a column, in place.
+
+        Parameters:
+        - col: The column to play. It must not be full.
+
+        Returns:
+        - The row where the piece was placed.
+        """
+        height = self.heights[col]
+        self.pieces[len(self.moves) & 1] |= 1 << (col * self.HEIGHT + height)
+        self.heights[col] = height + 1
+        self.moves.append(col)
+        return self.ROWS - 1 - height
+
+    def undo(self):
+        """
+        Takes back the last move played.
+
+        Returns:
+        - The column of the move that was taken back.
+        """
+        col = self.moves.pop()
+        height = self.heights[col] - 1
+        self.heights[col] = height
+        self.pieces[len(self.moves) & 1] &= ~(1 << (col * self.HEIGHT + height))
+        return col
+
+    def legal_moves(self):
+        """
+        Returns:
+        - A list of the columns that can accept another piece.
+        """
+        return [c for c in range(self.COLS) if self.heights[c] < self.ROWS]
+
+    def is_valid_location(self, col):
+        """
+        Checks if the column can accept another piece.
+
+        Parameters:
+        - col: The column to check.
+
+        Returns:
+        - True if the column can accept another piece, False otherwise.
+        """
+        return self.heights[col] < self.ROWS
+
+    def get_next_open_row(self, col):
+        """
+        Gets the next open row in the column.
+
+        Parameters:
+        - col: The column to check.
+
+        Returns:
+        - The row number of the next open row, or None if the column is full.
+        """
+        if self.heights[col] >= self.ROWS:
+            return None
+        return self.ROWS - 1 - self.heights[col]
+
+    def winning_move(self, piece):
+        """
+        Checks if the given piece has a winning move.
+
+        Parameters:
+        - piece: The player's piece (1 or 2) to check.
+
+        Returns:
+        - True if the piece has a winning move, False otherwise.
+        """
+        return self.has_four(self.pieces[piece - 1])
+
+    @classmethod
+    def has_four(cls, bits):
+        """
+        Checks if a bitboard contains four aligned pieces.
+
+        Parameters:
+        - bits: The bitboard to check.
+
+        Returns:
+        - True if the bitboard contains four in a row, False otherwise.
+        """
+        # Vertical, horizontal, and the two diagonals.
+        for shift in (1, cls.HEIGHT, cls.HEIGHT - 1, cls.HEIGHT + 1):
+            pairs = bits & (bits >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
+        return False
+
+    def winning_cells(self, row, col, piece):
+        """
+        Checks the four lines through a placed piece for a win.
+
+        Parameters:
+        - row: The row of the piece that was just placed.
+        - col: The column of the piece that was just placed.
+        - piece: The player's piece (1 or 2) to check.
+
+        Returns:
+        - A list of (row, col) tuples forming the winning line, or None if there is no win.
+        """
+        bits = self.pieces[piece - 1]
+        # Most moves do not win, and the shift-and-AND test rules them out without visiting any cell.
+        if not self.has_four(bits):
+            return None
+        pos = col * self.HEIGHT + self.ROWS - 1 - row
+        # The bit offset of one step along each line, in the same order as Board.winning_cells. The
+        # empty row above every column keeps a walk from wrapping into the next column.
+        for step in (self.HEIGHT, -1, self.HEIGHT - 1, -self.HEIGHT - 1):
+            start = pos
+            while start - step >= 0 and bits >> (start - step) & 1:
+                start -= step
+            end = pos
+            while end + step >= 0 and bits >> (end + step) & 1:
+                end += step
+            if (end - start) // step >= 3:
+                return [(self.ROWS - 1 - p % self.HEIGHT, p // self.HEIGHT) for p in range(start, end + step, step)]
+        return None
+
+    def is_draw(self):
+        """
+        Checks if the game is a draw.
+
+        Returns:
+        - True if the game is a draw, False otherwise.
+        """
+        return len(self.moves) == self.ROWS * self.COLS
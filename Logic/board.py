@@ -1,67 +1,33 @@
-import pygame
-
-
 class Board:
     """
     Class that handles the board logic for Connect Four.
+
+    The rules do not depend on pygame, so headless workers can import them
+    cheaply. Drawing lives in UI.board_view.BoardView.
     """
     ROWS = 6
     COLS = 7
-    SQUARESIZE = 100
-    RADIUS = SQUARESIZE // 2 - 5
 
     def __init__(self):
         """
         Initializes an empty board.
         """
         self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.heights = [0] * self.COLS
+        self.moves = []
 
-    def draw(self, screen):
+    def piece_at(self, row, col):
         """
-        Draws the board on the screen.
+        Reads one cell.
 
         Parameters:
-        - screen: The pygame screen surface where the board will be drawn.
-        """
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                pygame.draw.rect(screen, (0, 0, 255), (
-                c * self.SQUARESIZE, r * self.SQUARESIZE + self.SQUARESIZE, self.SQUARESIZE, self.SQUARESIZE))
-                if self.board[r][c] == 0:
-                    pygame.draw.circle(screen, (0, 0, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2,
-                                                           r * self.SQUARESIZE + self.SQUARESIZE + self.SQUARESIZE // 2),
-                                       self.RADIUS)
-                elif self.board[r][c] == 1:
-                    pygame.draw.circle(screen, (255, 0, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2,
-                                                             r * self.SQUARESIZE + self.SQUARESIZE + self.SQUARESIZE // 2),
-                                       self.RADIUS)
-                else:
-                    pygame.draw.circle(screen, (255, 255, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2,
-                                                               r * self.SQUARESIZE + self.SQUARESIZE + self.SQUARESIZE // 2),
-                                       self.RADIUS)
-
-    def animate_drop(self, screen, col, piece, sound=None):
-        """
-        Animates the drop of a piece into the board.
+        - row: The row of the cell, 0 at the top.
+        - col: The column of the cell.
 
-        Parameters:
-        - screen: The pygame screen surface where the animation will be drawn.
-        - col: The column where the piece will be dropped.
-        - piece: The player's piece (1 or 2) to be dropped.
-        - sound: The sound to play when the piece is dropped (optional).
-        """
-        row = self.get_next_open_row(col)
-        if row is not None:
-            for r in range(row + 1):
-                self.draw(screen)
-                pygame.draw.circle(screen, (255, 0, 0) if piece == 1 else (255, 255, 0), (
-                    col * self.SQUARESIZE + self.SQUARESIZE // 2, r * self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-                pygame.display.update()
-                pygame.time.wait(50)
-            self.drop_piece(row, col, piece)
-            if sound:
-                sound.play()
-            self.bounce_effect(screen, col, row, piece)
+        Returns:
+        - The piece (1 or 2) in the cell, or 0 if it is empty.
+        """
+        return self.board[row][col]
 
     def drop_piece(self, row, col, piece):
         """
@@ -73,6 +39,50 @@ class Board:
         - piece: The player's piece (1 or 2) to be placed.
         """
         self.board[row][col] = piece
+        self.heights[col] = max(self.heights[col], self.ROWS - row)
+        self.moves.append(col)
+
+    def current_piece(self):
+        """
+        Returns:
+        - The piece (1 or 2) of the player whose turn it is.
+        """
+        return len(self.moves) % 2 + 1
+
+    def play(self, col):
+        """
+        Plays the current player's piece in a column, in place.
+
+        Parameters:
+        - col: The column to play. It must not be full.
+
+        Returns:
+        - The row where the piece was placed.
+        """
+        row = self.ROWS - 1 - self.heights[col]
+        self.board[row][col] = len(self.moves) % 2 + 1
+        self.heights[col] += 1
+        self.moves.append(col)
+        return row
+
+    def undo(self):
+        """
+        Takes back the last move played.
+
+        Returns:
+        - The column of the move that was taken back.
+        """
+        col = self.moves.pop()
+        self.heights[col] -= 1
+        self.board[self.ROWS - 1 - self.heights[col]][col] = 0
+        return col
+
+    def legal_moves(self):
+        """
+        Returns:
+        - A list of the columns that can accept another piece.
+        """
+        return [c for c in range(self.COLS) if self.heights[c] < self.ROWS]
 
     def is_valid_location(self, col):
         """
@@ -84,7 +94,7 @@ class Board:
         Returns:
         - True if the column can accept another piece, False otherwise.
         """
-        return self.board[0][col] == 0
+        return self.heights[col] < self.ROWS
 
     def get_next_open_row(self, col):
         """
@@ -96,10 +106,9 @@ class Board:
         Returns:
         - The row number of the next open row, or None if the column is full.
         """
-        for r in range(self.ROWS - 1, -1, -1):
-            if self.board[r][col] == 0:
-                return r
-        return None
+        if self.heights[col] >= self.ROWS:
+            return None
+        return self.ROWS - 1 - self.heights[col]
 
     def winning_move(self, piece):
         """
@@ -137,6 +146,33 @@ class Board:
 
         return False
 
+    def winning_cells(self, row, col, piece):
+        """
+        Checks the four lines through a placed piece for a win.
+
+        Only the cells on the horizontal, vertical and two diagonal lines through
+        (row, col) are examined, so the cost does not depend on the board size.
+
+        Parameters:
+        - row: The row of the piece that was just placed.
+        - col: The column of the piece that was just placed.
+        - piece: The player's piece (1 or 2) to check.
+
+        Returns:
+        - A list of (row, col) tuples forming the winning line, or None if there is no win.
+        """
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            r, c = row, col
+            while 0 <= r - dr < self.ROWS and 0 <= c - dc < self.COLS and self.board[r - dr][c - dc] == piece:
+                r, c = r - dr, c - dc
+            cells = []
+            while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r][c] == piece:
+                cells.append((r, c))
+                r, c = r + dr, c + dc
+            if len(cells) >= 4:
+                return cells
+        return None
+
     def is_draw(self):
         """
         Checks if the game is a draw.
@@ -144,30 +180,4 @@ class Board:
         Returns:
         - True if the game is a draw, False otherwise.
         """
-        for c in range(self.COLS):
-            if self.is_valid_location(c):
-                return False
-        return True
-
-    def bounce_effect(self, screen, col, row, piece):
-        """
-        Animates a bounce effect when a piece is dropped.
-
-        Parameters:
-        - screen: The pygame screen surface where the animation will be drawn.
-        - col: The column where the piece was dropped.
-        - row: The row where the piece was placed.
-        - piece: The player's piece (1 or 2) that was placed.
-        """
-        for i in range(3):
-            self.draw(screen)
-            pygame.draw.circle(screen, (255, 0, 0) if piece == 1 else (255, 255, 0), (
-                col * self.SQUARESIZE + self.SQUARESIZE // 2, row * self.SQUARESIZE + self.SQUARESIZE // 2 - 10),
-                               self.RADIUS)
-            pygame.display.update()
-            pygame.time.wait(100)
-            self.draw(screen)
-            pygame.draw.circle(screen, (255, 0, 0) if piece == 1 else (255, 255, 0), (
-                col * self.SQUARESIZE + self.SQUARESIZE // 2, row * self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-            pygame.display.update()
-            pygame.time.wait(100)
+        return len(self.moves) == self.ROWS * self.COLS
@@ -0,0 +1,265 @@
+DIRECTIONS = ((1, 0), (0, 1), (1, -1), (1, 1))
+
+
+class ConnectKBoard:
+    """
+    Class that handles the board logic for Connect-K on boards of any size, up to 50x50.
+
+    It offers the same methods as Board, with row 0 at the top, but stores
+    only the pieces that were played: one stack per column, bottom first. For
+    each of the four line directions, the length of every run of same-colour
+    pieces is kept at the run's two end cells and updated incrementally when
+    a piece joins or links runs. Checking a move for a win therefore costs a
+    few dictionary lookups, whatever the board size, and undo restores the
+    previous lengths from a log.
+    """
+    MAX_SIZE = 50
+
+    def __init__(self, rows=6, cols=7, k=4):
+        """
+        Initializes an empty board.
+
+        Parameters:
+        - rows: The number of rows.
+        - cols: The number of columns.
+        - k: The number of pieces in a row needed to win.
+        """
+        if not (1 <= rows <= self.MAX_SIZE and 1 <= cols <= self.MAX_SIZE):
+            raise ValueError(f"board size must be between 1x1 and {self.MAX_SIZE}x{self.MAX_SIZE}")
+        if not 2 <= k <= max(rows, cols):
+            raise ValueError(f"k must be between 2 and {max(rows, cols)}")
+        self.ROWS = rows
+        self.COLS = cols
+        self.K = k
+        self.columns = [[] for _ in range(cols)]
+        self.heights = [0] * cols
+        self.moves = []
+        # One dict per direction, mapping the end cells of each run to the run's length.
+        self.runs = [{} for _ in DIRECTIONS]
+        self.longest = []
+        self.undo_log = []
+        self.winner = 0
+
+    @property
+    def board(self):
+        """
+        Builds a dense grid of the pieces, for callers that index board[row][col].
+        Costs rows * cols; piece_at() reads a single cell without it.
+
+        Returns:
+        - A list of rows, row 0 at the top, holding 0 for an empty cell or the piece.
+        """
+        grid = [[0] * self.COLS for _ in range(self.ROWS)]
+        for col, stack in enumerate(self.columns):
+            for height, piece in enumerate(stack):
+                grid[self.ROWS - 1 - height][col] = piece
+        return grid
+
+    def piece_at(self, row, col):
+        """
+        Reads one cell.
+
+        Parameters:
+        - row: The row of the cell, 0 at the top.
+        - col: The column of the cell.
+
+        Returns:
+        - The piece (1 or 2) in the cell, or 0 if it is empty.
+        """
+        stack = self.columns[col]
+        height = self.ROWS - 1 - row
+        return stack[height] if height < len(stack) else 0
+
+    def piece_at_height(self, col, height):
+        """
+        Reads one cell, counting rows from the bottom. Cells off the board read as empty.
+
+        Parameters:
+        - col: The column of the cell.
+        - height: The row of the cell, 0 at the bottom.
+
+        Returns:
+        - The piece (1 or 2) in the cell, or 0 if it is empty or off the board.
+        """
+        if 0 <= col < self.COLS and 0 <= height:
+            stack = self.columns[col]
+            if height < len(stack):
+                return stack[height]
+        return 0
+
+    def drop_piece(self, row, col, piece):
+        """
+        Drops a piece into the board at the specified location. Pieces stack from
+        the bottom, so row must be the next open row of the column.
+
+        Parameters:
+        - row: The row where the piece will be placed.
+        - col: The column where the piece will be placed.
+        - piece: The player's piece (1 or 2) to be placed.
+        """
+        if row != self.get_next_open_row(col):
+            raise ValueError(f"row {row} is not the next open row of column {col}")
+        self.place(col, piece)
+
+    def current_piece(self):
+        """
+        Returns:
+        - The piece (1 or 2) of the player whose turn it is.
+        """
+        return len(self.moves) % 2 + 1
+
+    def play(self, col):
+        """
+        Plays the current player's piece in a column, in place.
+
+        Parameters:
+        - col: The column to play. It must not be full.
+
+        Returns:
+        - The row where the piece was placed.
+        """
+        return self.place(col, len(self.moves) % 2 + 1)
+
+    def place(self, col, piece):
+        """
+        Stacks a piece on a column and updates the run lengths through it.
+
+        Parameters:
+        - col: The column to play. It must not be full.
+        - piece: The piece (1 or 2) to place.
+
+        Returns:
+        - The row where the piece was placed.
+        """
+        height = self.heights[col]
+        self.columns[col].append(piece)
+        self.heights[col] += 1
+        self.moves.append(col)
+        log = []
+        longest = 0
+        for runs, (dc, dh) in zip(self.runs, DIRECTIONS):
+            # The neighbours, if they are ours, are end cells of their runs, so their lengths are stored.
+            before = runs[(col - dc, height - dh)] if self.piece_at_height(col - dc, height - dh) == piece else 0
+            after = runs[(col + dc, height + dh)] if self.piece_at_height(col + dc, height + dh) == piece else 0
+            length = before + 1 + after
+            for end in ((col - before * dc, height - before * dh), (col + after * dc, height + after * dh),
+                        (col, height)):
+                log.append((runs, end, runs.get(end)))
+                runs[end] = length
+            longest = max(longest, length)
+        self.undo_log.append((log, self.winner))
+        self.longest.append(longest)
+        if longest >= self.K and not self.winner:
+            self.winner = piece
+        return self.ROWS - 1 - height
+
+    def undo(self):
+        """
+        Takes back the last move played.
+
+        Returns:
+        - The column of the move that was taken back.
+        """
+        col = self.moves.pop()
+        self.columns[col].pop()
+        self.heights[col] -= 1
+        self.longest.pop()
+        log, self.winner = self.undo_log.pop()
+        for runs, end, length in reversed(log):
+            if length is None:
+                del runs[end]
+            else:
+                runs[end] = length
+        return col
+
+    def legal_moves(self):
+        """
+        Returns:
+        - A list of the columns that can accept another piece.
+        """
+        return [c for c in range(self.COLS) if self.heights[c] < self.ROWS]
+
+    def is_valid_location(self, col):
+        """
+        Checks if the column can accept another piece.
+
+        Parameters:
+        - col: The column to check.
+
+        Returns:
+        - True if the column can accept another piece, False otherwise.
+        """
+        return self.heights[col] < self.ROWS
+
+    def get_next_open_row(self, col):
+        """
+        Gets the next open row in the column.
+
+        Parameters:
+        - col: The column to check.
+
+        Returns:
+        - The row number of the next open row, or None if the column is full.
+        """
+        height = self.heights[col]
+        if height >= self.ROWS:
+            return None
+        return self.ROWS - 1 - height
+
+    def winning_move(self, piece):
+        """
+        Checks if the given piece has K in a row. The first player to line up K
+        pieces is remembered when the move is played, so this does not scan the board.
+
+        Parameters:
+        - piece: The player's piece (1 or 2) to check.
+
+        Returns:
+        - True if the piece has K in a row, False otherwise.
+        """
+        return self.winner == piece
+
+    def last_run(self):
+        """
+        Returns:
+        - The length of the longest line through the last piece played, or 0 on an empty board.
+        """
+        return self.longest[-1] if self.longest else 0
+
+    def winning_cells(self, row, col, piece):
+        """
+        Checks the four lines through a placed piece for K in a row.
+
+        At most K - 1 cells are read on each side of the piece, so the cost is
+        O(K) whatever the board size.
+
+        Parameters:
+        - row: The row of the piece that was just placed.
+        - col: The column of the piece that was just placed.
+        - piece: The player's piece (1 or 2) to check.
+
+        Returns:
+        - A list of (row, col) tuples forming the winning line, or None if there is no win.
+        """
+        height = self.ROWS - 1 - row
+        for dc, dh in DIRECTIONS:
+            before = 0
+            while before < self.K - 1 and \
+                    self.piece_at_height(col - (before + 1) * dc, height - (before + 1) * dh) == piece:
+                before += 1
+            after = 0
+            while before + after < self.K - 1 and \
+                    self.piece_at_height(col + (after + 1) * dc, height + (after + 1) * dh) == piece:
+                after += 1
+            if before + 1 + after >= self.K:
+                return [(self.ROWS - 1 - (height + i * dh), col + i * dc) for i in range(-before, after + 1)]
+        return None
+
+    def is_draw(self):
+        """
+        Checks if the game is a draw.
+
+        Returns:
+        - True if the game is a draw, False otherwise.
+        """
+        return len(self.moves) == self.ROWS * self.COLS
@@ -0,0 +1,164 @@
+import sqlite3
+import time
+from Logic.bitboard import BitBoard
+from Logic.negamax import WIN_SCORE, CELLS
+
+
+class EvalCache:
+    """
+    Persistent cache of position evaluations stored in a SQLite file.
+
+    The database runs in WAL mode, so several game processes can read and write
+    the same file. Every lookup refreshes the entry's last-used time, and when
+    the cache grows past max_entries the least recently used entries are evicted.
+    """
+
+    def __init__(self, path, max_entries=1_000_000, evict_fraction=0.1):
+        """
+        Opens the cache, creating the file if needed.
+
+        Parameters:
+        - path: The SQLite file.
+        - max_entries: The number of positions kept before eviction starts.
+        - evict_fraction: The share of max_entries removed each time the cap is reached.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_count = max(1, int(max_entries * evict_fraction))
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS positions ("
+            "key INTEGER PRIMARY KEY, score INTEGER, depth INTEGER, best_move INTEGER, used REAL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS positions_used ON positions (used)")
+        self.size = self.connection.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def get(self, key):
+        """
+        Looks up a position.
+
+        Parameters:
+        - key: The position key, as returned by BitBoard.key().
+
+        Returns:
+        - A (score, depth, best_move) tuple, or None if the position is not cached.
+        """
+        row = self.connection.execute(
+            "SELECT score, depth, best_move FROM positions WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self.connection.execute("UPDATE positions SET used = ? WHERE key = ?", (time.time(), key))
+        return row
+
+    def put(self, key, score, depth, best_move):
+        """
+        Stores a position, unless a deeper result is already cached.
+
+        Parameters:
+        - key: The position key, as returned by BitBoard.key().
+        - score: The score for the player to move.
+        - depth: The depth the position was searched to.
+        - best_move: The best column found.
+        """
+        cursor = self.connection.execute(
+            "INSERT INTO positions (key, score, depth, best_move, used) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET score = excluded.score, depth = excluded.depth, "
+            "best_move = excluded.best_move, used = excluded.used WHERE excluded.depth >= positions.depth",
+            (key, score, depth, best_move, time.time()))
+        # Updates are counted too, so the size is an upper bound until evict() recounts it.
+        self.size += cursor.rowcount
+        if self.size > self.max_entries:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries if the cache is over its cap.
+        """
+        self.size = self.connection.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        if self.size > self.max_entries:
+            self.connection.execute(
+                "DELETE FROM positions WHERE key IN (SELECT key FROM positions ORDER BY used LIMIT ?)",
+                (self.size - self.max_entries + self.evict_count,))
+            self.size = self.connection.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+
+class CachedPlayer:
+    """
+    Computer player that reuses cached evaluations and stores the results of a search player.
+
+    A cached evaluation is used when it is solved or at least as deep as the
+    wrapped player's last search that ran out of time, which is the depth its
+    time budget reaches. Searches cut short by a forced win are ignored. Until
+    the player has run out of time once, only evaluations searched to the end
+    are used.
+    """
+
+    def __init__(self, cache, player):
+        """
+        Initializes the player.
+
+        Parameters:
+        - cache: The EvalCache to use.
+        - player: A search player whose stats report "depth" and "score", such as NegamaxAI.
+        """
+        self.cache = cache
+        self.player = player
+        self.depth = 0
+        self.stats = {}
+
+    def choose_move(self, board):
+        """
+        Picks a column for the player to move.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        if not isinstance(board, BitBoard):
+            board = BitBoard.from_moves(board.moves)
+        key = board.key()
+        cached = self.cache.get(key)
+        if cached is not None:
+            score, depth, best_move = cached
+            needed = min(getattr(self.player, "max_depth", CELLS), CELLS - len(board.moves))
+            if self.depth:
+                needed = min(needed, self.depth)
+            if abs(score) >= WIN_SCORE - CELLS or depth >= needed:
+                self.stats = {"cached": True, "score": score, "depth": depth}
+                return best_move
+
+        move = self.player.choose_move(board)
+        self.stats = dict(self.player.stats, cached=False)
+        depth = self.stats.get("depth", 0)
+        if depth and self.stats.get("timed_out"):
+            self.depth = depth
+        if cached is not None and cached[1] > depth:
+            self.stats.update(cached=True, score=cached[0], depth=cached[1])
+            return cached[2]
+        if depth:
+            self.cache.put(key, self.stats["score"], depth, move)
+        return move
+
+    def new_game(self):
+        """
+        Tells the wrapped player a new game starts, if it keeps per-game state. The
+        depth the budget reaches does not depend on the game, so it is kept.
+        """
+        if hasattr(self.player, "new_game"):
+            self.player.new_game()
+
+    def close(self):
+        """
+        Closes the cache and the wrapped player.
+        """
+        self.cache.close()
+        if hasattr(self.player, "close"):
+            self.player.close()
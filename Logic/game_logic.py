@@ -1,13 +1,29 @@
 import pygame
 import sys
 from Logic.board import Board
+from UI.animation import Animator
+from UI.board_view import BoardView
+from UI.main_loop import MainLoop
+from Logic.negamax import CELLS, WIN_SCORE
+
+# Posted by the Ponderer's thread when a new hint is ready.
+HINT_EVENT = pygame.USEREVENT + 1
+
+
+def post_hint_event():
+    """
+    Wakes the game loop up to show a new hint. Safe to call from any thread.
+    """
+    pygame.event.post(pygame.event.Event(HINT_EVENT))
+
 
 class GameLogic:
     """
     Class that handles the game logic for Connect Four.
     """
 
-    def __init__(self, screen, drop_sound, win_sound):
+    def __init__(self, screen, drop_sound, win_sound, ai=None, ai_piece=2, skip_animations=False, loop=None,
+                 recorder=None, ponderer=None, assets=None, board=None):
         """
         Initializes the game logic with the screen, drop sound, and win sound.
 
@@ -15,211 +31,251 @@ class GameLogic:
         - screen: The pygame screen surface where the game will be displayed.
         - drop_sound: The sound played when a piece is dropped.
         - win_sound: The sound played when a player wins.
+        - ai: A computer player with a choose_move(board) method (optional).
+          When omitted, both players are human. Its new_game() method, if it has one, is called here.
+        - ai_piece: The piece (1 or 2) played by the computer.
+        - skip_animations: If True, moves are shown at once without animations.
+        - loop: The MainLoop that paces the game (optional). A new one is created if omitted.
+        - recorder: A GameRecordWriter that stores the finished game (optional).
+        - ponderer: A Ponderer that analyses the position while a human player thinks (optional).
+          Its hints are shown above the board.
+        - assets: The AssetManager used to render the hint text (optional). Needed to show hints.
+        - board: The empty board to play on (optional). Defaults to a standard Board; pass a
+          ConnectKBoard for larger boards or longer lines.
         """
         self.screen = screen
         self.running = True
-        self.board = Board()
+        self.board = board if board is not None else Board()
+        self.view = BoardView(self.board, screen.get_size())
         self.turn = 0
         self.drop_sound = drop_sound
         self.win_sound = win_sound
+        self.ai = ai
+        if hasattr(ai, "new_game"):
+            ai.new_game()
+        self.ai_piece = ai_piece
+        self.animator = Animator(skip=skip_animations)
+        self.result = None
+        self.loop = loop if loop is not None else MainLoop()
+        self.recorder = recorder
+        self.ponderer = ponderer
+        self.assets = assets
+        self.pondered = None
+        self.queued_click = None
 
     def run_game(self):
         """
         Runs the main game loop, handling events and updating the game state.
+        Animations advance once per frame while events keep being processed,
+        and the loop sleeps until the next event while waiting for a click.
+        A click made during an animation is kept and played as soon as the
+        animations end and it is a human player's turn; the computer's move
+        drops a click made before it.
 
         Returns:
         - The player number who wins (1 or 2), or 0 in case of a draw.
         """
-        self.board.draw(self.screen)
-        pygame.display.update()
+        self.redraw()
+
+        while self.running or self.animator.busy():
+            if self.ponderer is not None and self.waiting_for_human() and self.pondered != len(self.board.moves):
+                self.ponderer.analyse(self.board.moves)
+                self.pondered = len(self.board.moves)
 
-        while self.running:
-            for event in pygame.event.get():
+            active = self.animator.busy() or (self.running and self.is_ai_turn())
+            for event in self.loop.next_events(active):
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
 
+                if event.type == HINT_EVENT:
+                    self.show_hint()
+
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     posx = event.pos[0]
-                    col = posx // 100
+                    col = posx // self.view.SQUARESIZE
+                    if self.waiting_for_human():
+                        self.play_move(col)
+                    elif self.running and self.animator.busy():
+                        self.queued_click = col
+
+            if self.running and not self.animator.busy() and self.is_ai_turn():
+                self.queued_click = None
+                self.play_move(self.ai.choose_move(self.board))
+
+            self.animator.update(self.loop.frame_time)
+
+            if self.queued_click is not None and self.waiting_for_human():
+                col, self.queued_click = self.queued_click, None
+                self.play_move(col)
+
+        if self.ponderer is not None:
+            self.ponderer.pause()
+        return self.result
+
+    def is_ai_turn(self):
+        """
+        Returns:
+        - True if the computer player is to move, False otherwise.
+        """
+        return self.ai is not None and self.turn + 1 == self.ai_piece
+
+    def waiting_for_human(self):
+        """
+        Returns:
+        - True if the game is waiting for a human player to click a column, False otherwise.
+        """
+        return self.running and not self.animator.busy() and not self.is_ai_turn()
 
-                    if self.board.is_valid_location(col):
-                        row = self.board.get_next_open_row(col)
-                        if row is not None:
-                            self.board.animate_drop(self.screen, col, self.turn + 1, self.drop_sound)
+    def redraw(self):
+        """
+        Draws the board and shows it on the screen.
+        """
+        pygame.display.update(self.view.draw(self.screen))
 
-                            if self.board.winning_move(self.turn + 1):
-                                print(f"Player {self.turn + 1} wins!")
-                                self.running = False
-                                self.animate_winning_line(self.turn + 1)
-                                if self.win_sound:
-                                    self.win_sound.play()
-                                return self.turn + 1
+    def show_hint(self):
+        """
+        Shows the Ponderer's latest hint above the board, if it is for the current position.
+        """
+        hint = self.ponderer.latest_hint(self.board.moves)
+        if hint is None or not self.waiting_for_human():
+            return
+        score = hint["score"]
+        if abs(score) >= WIN_SCORE - CELLS:
+            plies = WIN_SCORE - abs(score) - len(self.board.moves) + 1
+            evaluation = f"{'win' if score > 0 else 'loss'} in {(plies + 1) // 2}"
+        else:
+            evaluation = f"{score:+d}"
+        label = None
+        if self.assets is not None:
+            # Rendered afresh rather than through assets.text, whose cache would keep every hint.
+            label = self.assets.font(30).render(f"Hint: {evaluation} (depth {hint['depth']})", True,
+                                                (255, 255, 255))
+        pygame.display.update(self.view.draw_hint(self.screen, hint["column"], self.turn + 1, label))
+
+    def play_sound(self, sound):
+        """
+        Plays a sound if it was loaded.
 
-                            if self.board.is_draw():
-                                print("Draw!")
-                                self.running = False
-                                return 0
+        Parameters:
+        - sound: The sound to play, or None.
+        """
+        if sound:
+            sound.play()
 
-                            self.turn += 1
-                            self.turn %= 2
+    def play_move(self, col):
+        """
+        Drops the current player's piece in a column, queues its animations and
+        checks for the end of the game.
 
-                    self.board.draw(self.screen)
-                    pygame.display.update()
+        Parameters:
+        - col: The column chosen by the current player.
 
+        Returns:
+        - The player number who wins (1 or 2), 0 in case of a draw, or None if the game goes on.
+        """
+        if not 0 <= col < self.board.COLS or not self.board.is_valid_location(col):
+            return None
+        piece = self.turn + 1
+        if self.ponderer is not None:
+            pygame.display.update(self.view.draw_hint(self.screen))
+        row = self.board.get_next_open_row(col)
+        self.board.drop_piece(row, col, piece)
+        self.animator.start(self.view.drop_animation(self.screen, col, row, piece),
+                            on_done=lambda: self.play_sound(self.drop_sound))
+        self.animator.start(self.view.bounce_animation(self.screen, col, row, piece), on_done=self.redraw)
+
+        winning_cells = self.board.winning_cells(row, col, piece)
+        if winning_cells:
+            print(f"Player {piece} wins!")
+            self.running = False
+            self.result = piece
+            self.record()
+            self.animator.start(self.winning_line_animation(piece, winning_cells),
+                                on_done=lambda: self.play_sound(self.win_sound))
+            return piece
+
+        if self.board.is_draw():
+            print("Draw!")
+            self.running = False
+            self.result = 0
+            self.record()
+            return 0
+
+        self.turn += 1
+        self.turn %= 2
         return None
 
-    def animate_winning_line(self, piece):
+    def record(self):
+        """
+        Appends the finished game to the game record log, if one is set.
+        """
+        if self.recorder is not None:
+            self.recorder.write(self.board.moves, self.result)
+
+    def winning_line_animation(self, piece, cells=None):
         """
         Animates the winning line when a player wins.
 
         Parameters:
         - piece: The player's piece (1 or 2) that formed the winning line.
+        - cells: The winning cells as returned by Board.winning_cells (optional).
+          When omitted, the pieces on the board are checked until a line is found.
+
+        Yields:
+        - The number of milliseconds to show each frame for.
         """
-        for c in range(self.board.COLS - 3):
+        if cells is None:
             for r in range(self.board.ROWS):
-                if self.board.board[r][c] == piece and self.board.board[r][c + 1] == piece and self.board.board[r][c + 2] == piece and self.board.board[r][c + 3] == piece:
-                    self.blink_winning_pieces([(r, c), (r, c + 1), (r, c + 2), (r, c + 3)])
-                    return
-
-        for c in range(self.board.COLS):
-            for r in range(self.board.ROWS - 3):
-                if self.board.board[r][c] == piece and self.board.board[r + 1][c] == piece and self.board.board[r + 2][c] == piece and self.board.board[r + 3][c] == piece:
-                    self.blink_winning_pieces([(r, c), (r + 1, c), (r + 2, c), (r + 3, c)])
-                    return
-
-        for c in range(self.board.COLS - 3):
-            for r in range(self.board.ROWS - 3):
-                if self.board.board[r][c] == piece and self.board.board[r + 1][c + 1] == piece and self.board.board[r + 2][c + 2] == piece and self.board.board[r + 3][c + 3] == piece:
-                    self.blink_winning_pieces([(r, c), (r + 1, c + 1), (r + 2, c + 2), (r + 3, c + 3)])
-                    return
-
-        for c in range(self.board.COLS - 3):
-            for r in range(3, self.board.ROWS):
-                if self.board.board[r][c] == piece and self.board.board[r - 1][c + 1] == piece and self.board.board[r - 2][c + 2] == piece and self.board.board[r - 3][c + 3] == piece:
-                    self.blink_winning_pieces([(r, c), (r - 1, c + 1), (r - 2, c + 2), (r - 3, c + 3)])
-                    return
-
-    def blink_winning_pieces(self, pieces):
+                for c in range(self.board.COLS):
+                    if self.board.board[r][c] == piece:
+                        cells = self.board.winning_cells(r, c, piece)
+                        if cells:
+                            break
+                if cells:
+                    break
+        if cells:
+            yield from self.blink_animation(cells)
+            yield from self.fireworks_animation(cells)
+
+    def blink_animation(self, pieces):
         """
         Blinks the winning pieces to highlight the winning line.
 
         Parameters:
         - pieces: A list of tuples representing the coordinates of the winning pieces.
+
+        Yields:
+        - The number of milliseconds to show each frame for.
         """
         for _ in range(5):
-            self.board.draw(self.screen)
+            area = self.view.draw(self.screen)
             for (r, c) in pieces:
-                pygame.draw.circle(self.screen, (0, 255, 0), (c * self.board.SQUARESIZE + self.board.SQUARESIZE // 2,
-                                                              r * self.board.SQUARESIZE + self.board.SQUARESIZE // 2),
-                                   self.board.RADIUS)
-            pygame.display.update()
-            pygame.time.wait(200)
-            self.board.draw(self.screen)
-            pygame.display.update()
-            pygame.time.wait(200)
-        self.animate_winning_fireworks(pieces)
-
-    def animate_winning_fireworks(self, pieces):
+                area.union_ip(self.view.draw_piece(self.screen, (0, 255, 0), (
+                    c * self.view.SQUARESIZE + self.view.SQUARESIZE // 2,
+                    r * self.view.SQUARESIZE + self.view.SQUARESIZE // 2)))
+            pygame.display.update(area)
+            yield 200
+            pygame.display.update(self.view.draw(self.screen))
+            yield 200
+
+    def fireworks_animation(self, pieces):
         """
         Displays a fireworks animation on the winning pieces.
 
         Parameters:
         - pieces: A list of tuples representing the coordinates of the winning pieces.
+
+        Yields:
+        - The number of milliseconds to show each frame for.
         """
         colors = [(255, 0, 0), (255, 255, 0), (0, 255, 0), (0, 0, 255)]
         for i in range(10):
-            self.board.draw(self.screen)
+            area = self.view.draw(self.screen)
             for (r, c) in pieces:
                 color = colors[i % len(colors)]
-                pygame.draw.circle(self.screen, color, (c * self.board.SQUARESIZE + self.board.SQUARESIZE // 2,
-                                                        r * self.board.SQUARESIZE + self.board.SQUARESIZE // 2),
-                                   self.board.RADIUS + i * 2)
-            pygame.display.update()
-            pygame.time.wait(100)
-
-class Board:
-    ROWS = 6
-    COLS = 7
-    SQUARESIZE = 100
-    RADIUS = SQUARESIZE // 2 - 5
-
-    def __init__(self):
-        self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
-
-    def draw(self, screen):
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                pygame.draw.rect(screen, (0, 0, 255), (c * self.SQUARESIZE, r * self.SQUARESIZE + self.SQUARESIZE, self.SQUARESIZE, self.SQUARESIZE))
-                if self.board[r][c] == 0:
-                    pygame.draw.circle(screen, (0, 0, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2, r * self.SQUARESIZE + self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-                elif self.board[r][c] == 1:
-                    pygame.draw.circle(screen, (255, 0, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2, r * self.SQUARESIZE + self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-                else:
-                    pygame.draw.circle(screen, (255, 255, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2, r * self.SQUARESIZE + self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-
-    def animate_drop(self, screen, col, piece, sound=None):
-        row = self.get_next_open_row(col)
-        if row is not None:
-            for r in range(row + 1):
-                self.draw(screen)
-                pygame.draw.circle(screen, (255, 0, 0) if piece == 1 else (255, 255, 0), (col * self.SQUARESIZE + self.SQUARESIZE // 2, r * self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-                pygame.display.update()
-                pygame.time.wait(50)
-            self.drop_piece(row, col, piece)
-            if sound:
-                sound.play()
-            self.bounce_effect(screen, col, row, piece)
-
-    def drop_piece(self, row, col, piece):
-        self.board[row][col] = piece
-
-    def is_valid_location(self, col):
-        return self.board[0][col] == 0
-
-    def get_next_open_row(self, col):
-        for r in range(self.ROWS - 1, -1, -1):
-            if self.board[r][col] == 0:
-                return r
-        return None
-
-    def winning_move(self, piece):
-        for c in range(self.COLS - 3):
-            for r in range(self.ROWS):
-                if self.board[r][c] == piece and self.board[r][c + 1] == piece and self.board[r][c + 2] == piece and self.board[r][c + 3] == piece:
-                    return True
-
-        for c in range(self.COLS):
-            for r in range(self.ROWS - 3):
-                if self.board[r][c] == piece and self.board[r + 1][c] == piece and self.board[r + 2][c] == piece and self.board[r + 3][c] == piece:
-                    return True
-
-        for c in range(self.COLS - 3):
-            for r in range(self.ROWS - 3):
-                if self.board[r][c] == piece and self.board[r + 1][c + 1] == piece and self.board[r + 2][c + 2] == piece and self.board[r + 3][c + 3] == piece:
-                    return True
-
-        for c in range(self.COLS - 3):
-            for r in range(3, self.ROWS):
-                if self.board[r][c] == piece and self.board[r - 1][c + 1] == piece and self.board[r - 2][c + 2] == piece and self.board[r - 3][c + 3] == piece:
-                    return True
-
-        return False
-
-    def is_draw(self):
-        for c in range(self.COLS):
-            if self.is_valid_location(c):
-                return False
-        return True
-
-    def bounce_effect(self, screen, col, row, piece):
-        for i in range(3):
-            self.draw(screen)
-            pygame.draw.circle(screen, (255, 0, 0) if piece == 1 else (255, 255, 0), (col * self.SQUARESIZE + self.SQUARESIZE // 2, row * self.SQUARESIZE + self.SQUARESIZE // 2 - 10), self.RADIUS)
-            pygame.display.update()
-            pygame.time.wait(100)
-            self.draw(screen)
-            pygame.draw.circle(screen, (255, 0, 0) if piece == 1 else (255, 255, 0), (col * self.SQUARESIZE + self.SQUARESIZE // 2, row * self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
-            pygame.display.update()
-            pygame.time.wait(100)
-
+                area.union_ip(self.view.draw_piece(self.screen, color, (
+                    c * self.view.SQUARESIZE + self.view.SQUARESIZE // 2,
+                    r * self.view.SQUARESIZE + self.view.SQUARESIZE // 2), self.view.RADIUS + i * 2))
+            pygame.display.update(area)
+            yield 100
@@ -0,0 +1,168 @@
+import glob
+import os
+import struct
+import time
+from Logic.board import Board
+
+
+MAGIC = b"C4GR\x01"
+RECORD_HEADER = struct.Struct("<BBI")
+NO_RESULT = 3
+
+
+def pack_moves(moves):
+    """
+    Packs a move sequence two columns per byte, first move in the low nibble.
+
+    Parameters:
+    - moves: The columns played, first move first.
+
+    Returns:
+    - The packed bytes.
+    """
+    packed = bytearray((len(moves) + 1) // 2)
+    for i, col in enumerate(moves):
+        packed[i >> 1] |= col << ((i & 1) * 4)
+    return bytes(packed)
+
+
+def unpack_moves(packed, count):
+    """
+    Unpacks a move sequence written by pack_moves.
+
+    Parameters:
+    - packed: The packed bytes.
+    - count: The number of moves.
+
+    Returns:
+    - The list of columns played.
+    """
+    return [(packed[i >> 1] >> ((i & 1) * 4)) & 0xF for i in range(count)]
+
+
+class GameRecordWriter:
+    """
+    Class that appends game records to a rolling set of binary log files.
+
+    Each file starts with a short magic string. Each record is a 6-byte header
+    (move count, result, Unix time) followed by the moves, one column per
+    nibble. When a file grows past max_bytes, a new file is started.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024, buffer_size=64 * 1024):
+        """
+        Opens the newest log file in a directory, creating the directory if needed.
+
+        Parameters:
+        - directory: The directory holding the log files.
+        - max_bytes: The size after which a new log file is started.
+        - buffer_size: The size of the write buffer.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+        os.makedirs(directory, exist_ok=True)
+        files = log_files(directory)
+        self.index = int(os.path.basename(files[-1])[6:11]) if files else 1
+        self.file = None
+        self.open()
+
+    def open(self):
+        """
+        Opens the current log file for appending.
+        """
+        path = os.path.join(self.directory, f"games-{self.index:05d}.c4r")
+        self.file = open(path, "ab", buffering=self.buffer_size)
+        self.size = self.file.tell()
+        if self.size == 0:
+            self.file.write(MAGIC)
+            self.size = len(MAGIC)
+
+    def write(self, moves, result, timestamp=None):
+        """
+        Appends one game.
+
+        Parameters:
+        - moves: The columns played, first move first.
+        - result: The winning piece (1 or 2), 0 for a draw, or NO_RESULT for an unfinished game.
+        - timestamp: The Unix time of the game (optional). Defaults to now.
+        """
+        if self.size >= self.max_bytes:
+            self.file.close()
+            self.index += 1
+            self.open()
+        record = RECORD_HEADER.pack(len(moves), result, int(time.time() if timestamp is None else timestamp))
+        record += pack_moves(moves)
+        self.file.write(record)
+        self.size += len(record)
+
+    def flush(self):
+        """
+        Writes the buffered records to disk.
+        """
+        self.file.flush()
+
+    def close(self):
+        """
+        Flushes and closes the current log file.
+        """
+        if not self.file.closed:
+            self.file.close()
+
+
+def log_files(directory):
+    """
+    Lists the log files in a directory, oldest first.
+
+    Parameters:
+    - directory: The directory holding the log files.
+
+    Returns:
+    - A sorted list of paths.
+    """
+    return sorted(glob.glob(os.path.join(directory, "games-[0-9][0-9][0-9][0-9][0-9].c4r")))
+
+
+def read_games(path, buffer_size=1024 * 1024):
+    """
+    Streams the games stored in a log file, or in every log file of a directory.
+
+    Parameters:
+    - path: A log file or a directory of log files.
+    - buffer_size: The size of the read buffer.
+
+    Yields:
+    - A (result, moves, timestamp) tuple for every game.
+    """
+    paths = log_files(path) if os.path.isdir(path) else [path]
+    header_size = RECORD_HEADER.size
+    for file_path in paths:
+        with open(file_path, "rb", buffering=buffer_size) as log:
+            if log.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{file_path} is not a game record log")
+            while True:
+                header = log.read(header_size)
+                if len(header) < header_size:
+                    break
+                count, result, timestamp = RECORD_HEADER.unpack(header)
+                packed = log.read((count + 1) // 2)
+                if len(packed) < (count + 1) // 2:
+                    break
+                yield result, unpack_moves(packed, count), timestamp
+
+
+def replay(moves, board=None):
+    """
+    Plays a recorded game onto a board.
+
+    Parameters:
+    - moves: The columns played, first move first.
+    - board: The board to play on (optional). Defaults to a new Board. Any board with play(col) works.
+
+    Returns:
+    - The board after the last move.
+    """
+    board = board if board is not None else Board()
+    for col in moves:
+        board.play(col)
+    return board
@@ -0,0 +1,198 @@
+import math
+import random
+import time
+from Logic.bitboard import BitBoard
+
+
+class Node:
+    """
+    Node of the Monte Carlo search tree.
+
+    wins counts the playout results from the point of view of the player who
+    made the move leading to the node: 1 for a win, 0.5 for a draw.
+    """
+    __slots__ = ("move", "parent", "children", "untried", "visits", "wins", "terminal")
+
+    def __init__(self, move, parent, untried):
+        """
+        Initializes a node.
+
+        Parameters:
+        - move: The column played to reach the node, or None for the root.
+        - parent: The parent node, or None for the root.
+        - untried: The legal columns that have no child node yet.
+        """
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+        self.terminal = None
+
+
+class MCTSAI:
+    """
+    Computer player that picks moves with Monte Carlo Tree Search (UCT).
+
+    The tree is kept between moves: when the next position is reached by moves
+    that are already in the tree, the matching subtree becomes the new root.
+    """
+
+    def __init__(self, time_limit=1.0, playouts=None, exploration=1.4, seed=None):
+        """
+        Initializes the player.
+
+        Parameters:
+        - time_limit: The time budget for a move, in seconds.
+        - playouts: The maximum number of playouts for a move (optional). At least 1.
+        - exploration: The UCT exploration constant.
+        - seed: The seed of the random number generator used for rollouts (optional).
+        """
+        if playouts is not None and playouts < 1:
+            raise ValueError("playouts must be at least 1")
+        self.time_limit = time_limit
+        self.playouts = playouts
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.root = None
+        self.root_moves = []
+        self.stats = {}
+
+    def choose_move(self, board):
+        """
+        Searches the position and picks a column for the player to move.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        if not isinstance(board, BitBoard):
+            board = BitBoard.from_moves(board.moves)
+        root = self.reuse_root(board)
+        reused = root.visits
+        start = time.perf_counter()
+        deadline = start + self.time_limit
+        playouts = 0
+
+        while (self.playouts is None or playouts < self.playouts) and \
+                (playouts == 0 or time.perf_counter() < deadline):
+            self.playout(board, root)
+            playouts += 1
+
+        elapsed = time.perf_counter() - start
+        self.stats = {
+            "playouts": playouts,
+            "reused_playouts": reused,
+            "seconds": elapsed,
+            "playouts_per_second": playouts / elapsed if elapsed else 0.0,
+        }
+        return max(root.children, key=lambda child: child.visits).move
+
+    def reuse_root(self, board):
+        """
+        Finds the node for the board's position in the kept tree, or starts a new tree.
+
+        Parameters:
+        - board: The BitBoard about to be searched.
+
+        Returns:
+        - The root node for the position.
+        """
+        moves = board.moves
+        node = self.root
+        if node is not None and moves[:len(self.root_moves)] == self.root_moves:
+            for col in moves[len(self.root_moves):]:
+                node = next((child for child in node.children if child.move == col), None)
+                if node is None:
+                    break
+        else:
+            node = None
+        if node is None or node.terminal is not None:
+            node = Node(None, None, board.legal_moves())
+        node.parent = None
+        self.root = node
+        self.root_moves = list(moves)
+        return node
+
+    def playout(self, board, root):
+        """
+        Runs one selection, expansion, rollout and backpropagation pass.
+
+        Parameters:
+        - board: The BitBoard holding the root position. It is restored before returning.
+        - root: The root node.
+        """
+        node = root
+        played = 0
+        log = math.log
+        sqrt = math.sqrt
+        c = self.exploration
+
+        while not node.untried and node.children and node.terminal is None:
+            log_visits = log(node.visits)
+            node = max(node.children,
+                       key=lambda child: child.wins / child.visits + c * sqrt(log_visits / child.visits))
+            board.play(node.move)
+            played += 1
+
+        if node.terminal is None and node.untried:
+            col = node.untried.pop(self.random.randrange(len(node.untried)))
+            mover = len(board.moves) & 1
+            won = BitBoard.has_four(board.pieces[mover] | 1 << (col * BitBoard.HEIGHT + board.heights[col]))
+            board.play(col)
+            played += 1
+            child = Node(col, node, board.legal_moves())
+            if won:
+                child.terminal = 1.0
+            elif board.is_draw():
+                child.terminal = 0.5
+            node.children.append(child)
+            node = child
+
+        value = node.terminal if node.terminal is not None else self.rollout(board)
+
+        while node is not None:
+            node.visits += 1
+            node.wins += value
+            value = 1.0 - value
+            node = node.parent
+        for _ in range(played):
+            board.undo()
+
+    def rollout(self, board):
+        """
+        Plays random moves until the game ends, then restores the board.
+
+        Parameters:
+        - board: The BitBoard to play out.
+
+        Returns:
+        - 1 if the player who made the last move before the rollout wins, 0 if they lose, 0.5 for a draw.
+        """
+        heights = board.heights
+        pieces = board.pieces
+        randrange = self.random.randrange
+        rows = BitBoard.ROWS
+        cols = BitBoard.COLS
+        height = BitBoard.HEIGHT
+        has_four = BitBoard.has_four
+        start = len(board.moves)
+        played = start
+        result = 0.5
+
+        while played < BitBoard.ROWS * BitBoard.COLS:
+            col = randrange(cols)
+            while heights[col] >= rows:
+                col = randrange(cols)
+            if has_four(pieces[played & 1] | 1 << (col * height + heights[col])):
+                result = 0.0 if (played - start) & 1 == 0 else 1.0
+                break
+            board.play(col)
+            played += 1
+
+        for _ in range(played - start):
+            board.undo()
+        return result
@@ -0,0 +1,350 @@
+import time
+from collections import OrderedDict
+from Logic.bitboard import BitBoard
+
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+WIN_SCORE = 100000
+CELLS = BitBoard.ROWS * BitBoard.COLS
+CENTER_ORDER = sorted(range(BitBoard.COLS), key=lambda c: abs(BitBoard.COLS // 2 - c))
+
+
+def _build_windows():
+    """
+    Builds the bitboard mask of every four-cell window on the board.
+
+    Returns:
+    - A list of integers, one per horizontal, vertical or diagonal window.
+    """
+    windows = []
+    for c in range(BitBoard.COLS):
+        for h in range(BitBoard.ROWS):
+            for dc, dh in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                if 0 <= c + 3 * dc < BitBoard.COLS and 0 <= h + 3 * dh < BitBoard.ROWS:
+                    windows.append(sum(1 << ((c + i * dc) * BitBoard.HEIGHT + h + i * dh) for i in range(4)))
+    return windows
+
+
+WINDOWS = _build_windows()
+WINDOW_WEIGHTS = (0, 1, 5, 50)
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget for the move runs out.
+    """
+
+
+class TranspositionTable:
+    """
+    Bounded table of search results keyed by BitBoard.key().
+
+    An existing entry is only replaced by a result searched at least as deep.
+    When the table is full, the oldest inserted entry is evicted to make room.
+    The entries live in an OrderedDict, whose popitem(last=False) evicts in
+    constant time; deleting the first key of a plain dict scans past every
+    slot freed by earlier evictions.
+    """
+
+    def __init__(self, max_entries=1 << 20):
+        """
+        Initializes an empty table.
+
+        Parameters:
+        - max_entries: The maximum number of positions kept in the table.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Looks up a position.
+
+        Parameters:
+        - key: The position key.
+
+        Returns:
+        - A (depth, value, flag, best_move) tuple, or None if the position is unknown.
+        """
+        self.lookups += 1
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+        return entry
+
+    def store(self, key, depth, value, flag, best_move):
+        """
+        Stores a search result, following the replacement policy.
+
+        Parameters:
+        - key: The position key.
+        - depth: The depth the position was searched to.
+        - value: The score found by the search.
+        - flag: EXACT, LOWER or UPPER depending on how the score relates to the true value.
+        - best_move: The best column found, or None.
+        """
+        entries = self.entries
+        old = entries.get(key)
+        if old is not None:
+            if old[0] > depth:
+                return
+        elif len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = (depth, value, flag, best_move)
+
+    def hit_rate(self):
+        """
+        Returns:
+        - The fraction of lookups that found an entry.
+        """
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def clear(self):
+        """
+        Removes every entry and resets the counters.
+        """
+        self.entries.clear()
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+
+
+class NegamaxAI:
+    """
+    Computer player that picks moves with an alpha-beta negamax search.
+
+    The search deepens iteratively until the time budget for the move runs out,
+    and keeps the best move of the deepest completed iteration.
+    """
+
+    def __init__(self, time_limit=1.0, max_depth=CELLS, table=None):
+        """
+        Initializes the player.
+
+        Parameters:
+        - time_limit: The time budget for a move, in seconds.
+        - max_depth: The deepest iteration the search will try.
+        - table: The TranspositionTable to use (optional). A new one is created if omitted.
+        """
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.table = table if table is not None else TranspositionTable()
+        self.nodes = 0
+        self.stats = {}
+        self._deadline = float("inf")
+
+    def set_deadline(self, deadline):
+        """
+        Sets when the running or next call to search_root or negamax stops. choose_move
+        sets its own deadline for every iteration. Safe to call from another thread.
+
+        Parameters:
+        - deadline: The time.perf_counter() value after which the search raises SearchTimeout,
+          or float("inf") to search until done.
+        """
+        self._deadline = deadline
+
+    def stop(self):
+        """
+        Makes the running search raise SearchTimeout at its next deadline check. Safe to call
+        from another thread.
+        """
+        self._deadline = 0.0
+
+    def choose_move(self, board):
+        """
+        Searches the position and picks a column for the player to move.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        if not isinstance(board, BitBoard):
+            board = BitBoard.from_moves(board.moves)
+        start = time.perf_counter()
+        root_moves = len(board.moves)
+        self.nodes = 0
+        lookups, hits = self.table.lookups, self.table.hits
+        best_move, best_score, completed = None, 0, 0
+        timed_out = False
+
+        for depth in range(1, min(self.max_depth, CELLS - root_moves) + 1):
+            self._deadline = start + self.time_limit if depth > 1 else float("inf")
+            try:
+                best_score, best_move = self.search_root(board, depth, -WIN_SCORE, WIN_SCORE, best_move)
+            except SearchTimeout:
+                while len(board.moves) > root_moves:
+                    board.undo()
+                timed_out = True
+                break
+            completed = depth
+            if abs(best_score) >= WIN_SCORE - CELLS:
+                break
+
+        elapsed = time.perf_counter() - start
+        lookups = self.table.lookups - lookups
+        self.stats = {
+            "depth": completed,
+            # Only a search stopped by the budget shows how deep the budget reaches.
+            "timed_out": timed_out,
+            "score": best_score,
+            "nodes": self.nodes,
+            "seconds": elapsed,
+            "nodes_per_second": self.nodes / elapsed if elapsed else 0.0,
+            "tt_hit_rate": (self.table.hits - hits) / lookups if lookups else 0.0,
+            "tt_entries": len(self.table.entries),
+        }
+        if best_move is None:
+            best_move = board.legal_moves()[0]
+        return best_move
+
+    def search_root(self, board, depth, alpha, beta, first_move=None):
+        """
+        Searches every move of the root position to a fixed depth.
+
+        Parameters:
+        - board: The BitBoard to search. It is restored before returning.
+        - depth: The number of plies to search.
+        - alpha: The lower bound of the search window.
+        - beta: The upper bound of the search window.
+        - first_move: A column to try before the others (optional).
+
+        Returns:
+        - A (score, column) tuple for the best move found.
+        """
+        moves = self.ordered_moves(board, first_move)
+        me = board.pieces[len(board.moves) & 1]
+        for col in moves:
+            if BitBoard.has_four(me | 1 << (col * BitBoard.HEIGHT + board.heights[col])):
+                return WIN_SCORE - len(board.moves), col
+
+        best_score, best_move = -WIN_SCORE, moves[0]
+        for col in moves:
+            board.play(col)
+            score = -self.negamax(board, depth - 1, -beta, -alpha)
+            board.undo()
+            if score > best_score:
+                best_score, best_move = score, col
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        return best_score, best_move
+
+    def negamax(self, board, depth, alpha, beta):
+        """
+        Scores a position from the point of view of the player to move.
+
+        Parameters:
+        - board: The BitBoard to search. It is restored before returning.
+        - depth: The number of plies left to search.
+        - alpha: The lower bound of the search window.
+        - beta: The upper bound of the search window.
+
+        Returns:
+        - The score of the position.
+        """
+        self.nodes += 1
+        if not self.nodes & 1023 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        played = len(board.moves)
+        if played == CELLS:
+            return 0
+        heights = board.heights
+        me = board.pieces[played & 1]
+        for col in CENTER_ORDER:
+            if heights[col] < BitBoard.ROWS and BitBoard.has_four(me | 1 << (col * BitBoard.HEIGHT + heights[col])):
+                return WIN_SCORE - played
+        if depth == 0:
+            return self.evaluate(board)
+
+        key = board.key()
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[3]
+            if entry[0] >= depth:
+                value, flag = entry[1], entry[2]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER and value > alpha:
+                    alpha = value
+                elif flag == UPPER and value < beta:
+                    beta = value
+                if alpha >= beta:
+                    return value
+
+        alpha_orig = alpha
+        best_score, best_move = -WIN_SCORE, None
+        for col in self.ordered_moves(board, tt_move):
+            board.play(col)
+            score = -self.negamax(board, depth - 1, -beta, -alpha)
+            board.undo()
+            if score > best_score:
+                best_score, best_move = score, col
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.store(key, depth, best_score, flag, best_move)
+        return best_score
+
+    @staticmethod
+    def ordered_moves(board, first_move=None):
+        """
+        Lists the legal columns, center first.
+
+        Parameters:
+        - board: The BitBoard to list moves for.
+        - first_move: A column to put at the front of the list (optional).
+
+        Returns:
+        - A list of columns.
+        """
+        heights = board.heights
+        moves = [c for c in CENTER_ORDER if heights[c] < BitBoard.ROWS]
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
+    @staticmethod
+    def evaluate(board):
+        """
+        Scores a position by the open four-cell windows each player is building.
+
+        Parameters:
+        - board: The BitBoard to score.
+
+        Returns:
+        - The score from the point of view of the player to move.
+        """
+        played = len(board.moves)
+        me = board.pieces[played & 1]
+        opponent = board.pieces[(played + 1) & 1]
+        score = 0
+        for window in WINDOWS:
+            mine = me & window
+            theirs = opponent & window
+            if not theirs:
+                score += WINDOW_WEIGHTS[mine.bit_count()]
+            elif not mine:
+                score -= WINDOW_WEIGHTS[theirs.bit_count()]
+        return score
@@ -0,0 +1,203 @@
+import mmap
+import os
+import struct
+from Logic.bitboard import BitBoard
+from Logic.negamax import NegamaxAI
+
+
+MAGIC = b"C4BK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+RECORD = struct.Struct("<QiB")
+COLUMN_MASK = (1 << BitBoard.HEIGHT) - 1
+
+
+def mirror(bits):
+    """
+    Mirrors a bitboard or position key left to right.
+
+    Parameters:
+    - bits: The bitboard or key to mirror.
+
+    Returns:
+    - The mirrored value.
+    """
+    mirrored = 0
+    for c in range(BitBoard.COLS):
+        mirrored |= ((bits >> (c * BitBoard.HEIGHT)) & COLUMN_MASK) << ((BitBoard.COLS - 1 - c) * BitBoard.HEIGHT)
+    return mirrored
+
+
+def canonical_key(board):
+    """
+    Builds the key under which a position is stored in the book. A position and
+    its mirror image share one entry.
+
+    Parameters:
+    - board: The BitBoard to look up.
+
+    Returns:
+    - A (key, mirrored) tuple, where mirrored is True if the key belongs to the mirror image.
+    """
+    key = board.key()
+    mirrored_key = mirror(key)
+    if mirrored_key < key:
+        return mirrored_key, True
+    return key, False
+
+
+def build_book(path, plies=6, search_depth=8, progress=None):
+    """
+    Evaluates every position up to a number of plies and writes the opening book.
+
+    Parameters:
+    - path: The file to write.
+    - plies: The deepest position, in moves from the empty board, stored in the book.
+    - search_depth: The negamax depth used to evaluate each position.
+    - progress: A function called with the number of positions evaluated so far (optional).
+
+    Returns:
+    - The number of positions written.
+    """
+    ai = NegamaxAI(time_limit=float("inf"), max_depth=search_depth)
+    entries = {}
+    board = BitBoard()
+
+    def visit():
+        key, mirrored = canonical_key(board)
+        if key in entries:
+            return
+        move = ai.choose_move(board)
+        entries[key] = (ai.stats["score"], BitBoard.COLS - 1 - move if mirrored else move)
+        if progress is not None:
+            progress(len(entries))
+        if len(board.moves) == plies:
+            return
+        me = len(board.moves) & 1
+        for col in board.legal_moves():
+            if BitBoard.has_four(board.pieces[me] | 1 << (col * BitBoard.HEIGHT + board.heights[col])):
+                continue
+            board.play(col)
+            visit()
+            board.undo()
+
+    visit()
+    data = bytearray(HEADER.pack(MAGIC, VERSION, plies, len(entries)))
+    for key in sorted(entries):
+        score, move = entries[key]
+        data += RECORD.pack(key, score, move)
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as book_file:
+        book_file.write(data)
+    os.replace(temporary, path)
+    return len(entries)
+
+
+class OpeningBook:
+    """
+    Read-only opening book backed by a memory-mapped file.
+
+    The records are sorted by position key and looked up with a binary search
+    directly in the mapped pages, so nothing is parsed up front and processes
+    that open the same file share its memory.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps the book file.
+
+        Parameters:
+        - path: The book file written by build_book.
+        """
+        with open(path, "rb") as book_file:
+            self.data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.plies, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+
+    def close(self):
+        """
+        Unmaps the book file.
+        """
+        self.data.close()
+
+    def lookup(self, board):
+        """
+        Looks up a position.
+
+        Parameters:
+        - board: A Board or BitBoard.
+
+        Returns:
+        - A (move, score) tuple for the player to move, or None if the position is not in the book.
+        """
+        if len(board.moves) > self.plies:
+            return None
+        if not isinstance(board, BitBoard):
+            board = BitBoard.from_moves(board.moves)
+        key, mirrored = canonical_key(board)
+        data = self.data
+        unpack_from = RECORD.unpack_from
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            found, score, move = unpack_from(data, HEADER.size + middle * RECORD.size)
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                return (BitBoard.COLS - 1 - move if mirrored else move), score
+        return None
+
+
+class BookPlayer:
+    """
+    Computer player that plays from an opening book and falls back to another player out of book.
+    """
+
+    def __init__(self, book, fallback):
+        """
+        Initializes the player.
+
+        Parameters:
+        - book: The OpeningBook to play from.
+        - fallback: The computer player used for positions that are not in the book.
+        """
+        self.book = book
+        self.fallback = fallback
+        self.stats = {}
+
+    def choose_move(self, board):
+        """
+        Picks a column for the player to move.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        entry = self.book.lookup(board)
+        if entry is not None:
+            self.stats = {"book": True, "score": entry[1]}
+            return entry[0]
+        move = self.fallback.choose_move(board)
+        self.stats = dict(self.fallback.stats, book=False)
+        return move
+
+    def new_game(self):
+        """
+        Tells the fallback player a new game starts, if it keeps per-game state.
+        """
+        if hasattr(self.fallback, "new_game"):
+            self.fallback.new_game()
+
+    def close(self):
+        """
+        Closes the book and the fallback player.
+        """
+        self.book.close()
+        if hasattr(self.fallback, "close"):
+            self.fallback.close()
@@ -0,0 +1,301 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from Logic.bitboard import BitBoard
+from Logic.negamax import NegamaxAI, SearchTimeout, TranspositionTable, WIN_SCORE, CELLS
+
+
+# Root moves searched to at least this depth are split further, one task per reply.
+SPLIT_DEPTH = 6
+
+_worker_ai = None
+
+
+def _init_worker(table_size):
+    """
+    Sets up the search state of a worker process. The state lives for as long
+    as the process, so each worker keeps its transposition table across moves.
+
+    Parameters:
+    - table_size: The maximum number of entries in the worker's transposition table.
+    """
+    global _worker_ai
+    _worker_ai = NegamaxAI(table=TranspositionTable(table_size))
+
+
+def _search(moves, depth, alpha, beta, end_time):
+    """
+    Scores a position in a worker process.
+
+    Parameters:
+    - moves: The columns played to reach the position.
+    - depth: The number of plies to search.
+    - alpha: The lower bound of the search window.
+    - beta: The upper bound of the search window.
+    - end_time: The time.time() value at which the search must stop.
+
+    Returns:
+    - A (score, nodes, tt_hits, tt_lookups) tuple, with the score for the player to move,
+      or None if the search ran out of time.
+    """
+    ai = _worker_ai
+    table = ai.table
+    ai.nodes = 0
+    hits, lookups = table.hits, table.lookups
+    remaining = end_time - time.time()
+    if remaining <= 0:
+        return None, 0, 0, 0
+    ai.set_deadline(time.perf_counter() + remaining)
+    try:
+        score = ai.negamax(BitBoard.from_moves(moves), depth, alpha, beta)
+    except SearchTimeout:
+        score = None
+    return score, ai.nodes, table.hits - hits, table.lookups - lookups
+
+
+class ParallelNegamaxAI:
+    """
+    Computer player that splits a negamax search across a process pool.
+
+    Each iteration follows the young brothers wait rule: the first root move,
+    the best one of the previous iteration, is searched alone with the full
+    window to set alpha. The other root moves are then searched at once, each
+    only testing with a null window whether it beats alpha, which is enough to
+    refute it and prunes far more than a full window. A move that passes the
+    test is searched again with the window above alpha. Deep enough moves are
+    split once more: their first reply is tested alone, and only if it fails
+    to refute the move are the remaining replies tested in parallel, so there
+    are more tasks than root moves to keep a large pool busy.
+
+    Every worker process has its own transposition table, so each task goes to
+    the worker picked by its root move and reply. The same subtree is then
+    searched by the same worker in every iteration and every move, and finds
+    the entries of the previous ones. The workers are started on first use and
+    reused for every move until close() is called.
+    """
+
+    def __init__(self, time_limit=1.0, max_depth=CELLS, workers=None, table_size=1 << 20):
+        """
+        Initializes the player.
+
+        Parameters:
+        - time_limit: The time budget for a move, in seconds.
+        - max_depth: The deepest iteration the search will try.
+        - workers: The number of worker processes (optional). Defaults to the number of CPUs.
+        - table_size: The maximum number of entries in each worker's transposition table.
+        """
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.workers = workers or os.cpu_count() or 1
+        self.table_size = table_size
+        self.stats = {}
+        self._executors = None
+        self._counts = [0, 0, 0]
+
+    def _pool(self):
+        """
+        Returns:
+        - A list of single-process pools, one per worker, started on first use.
+        """
+        if self._executors is None:
+            self._executors = [ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                                   initargs=(self.table_size,)) for _ in range(self.workers)]
+        return self._executors
+
+    def close(self):
+        """
+        Shuts down the worker processes.
+        """
+        if self._executors is not None:
+            for executor in self._executors:
+                executor.shutdown()
+            self._executors = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def choose_move(self, board):
+        """
+        Searches the position and picks a column for the player to move.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        if not isinstance(board, BitBoard):
+            board = BitBoard.from_moves(board.moves)
+        start = time.perf_counter()
+        end_time = time.time() + self.time_limit
+        self._counts = [0, 0, 0]
+        best_move, best_score, completed = None, 0, 0
+        timed_out = False
+
+        me = board.pieces[len(board.moves) & 1]
+        for col in NegamaxAI.ordered_moves(board):
+            if BitBoard.has_four(me | 1 << (col * BitBoard.HEIGHT + board.heights[col])):
+                best_move, best_score = col, WIN_SCORE - len(board.moves)
+                break
+
+        pool = self._pool()
+        for depth in range(1, min(self.max_depth, CELLS - len(board.moves)) + 1):
+            if best_move is not None and abs(best_score) >= WIN_SCORE - CELLS:
+                break
+            result = self.search_root(pool, board, depth, best_move, end_time if depth > 1 else float("inf"))
+            if result is None:
+                timed_out = True
+                break
+            best_score, best_move = result
+            completed = depth
+
+        elapsed = time.perf_counter() - start
+        nodes, hits, lookups = self._counts
+        self.stats = {
+            "depth": completed,
+            "timed_out": timed_out,
+            "score": best_score,
+            "nodes": nodes,
+            "seconds": elapsed,
+            "nodes_per_second": nodes / elapsed if elapsed else 0.0,
+            "tt_hit_rate": hits / lookups if lookups else 0.0,
+            "workers": self.workers,
+        }
+        if best_move is None:
+            best_move = board.legal_moves()[0]
+        return best_move
+
+    def submit(self, pool, pending, task, moves, depth, alpha, beta, end_time):
+        """
+        Hands a position to the worker that searched it before.
+
+        Parameters:
+        - pool: The list of worker pools.
+        - pending: The dict of running futures, which the new one is added to.
+        - task: A (kind, col, reply, alpha) tuple telling what the result is for.
+        - moves: The columns played to reach the position.
+        - depth: The number of plies to search.
+        - alpha: The lower bound of the search window.
+        - beta: The upper bound of the search window.
+        - end_time: The time.time() value at which the search must stop.
+        """
+        kind, col, reply, _ = task
+        # Split replies get workers of their own; everything else about a root move stays on one worker.
+        key = (col + 1) * BitBoard.COLS + reply if kind == "reply" else col
+        worker = pool[key % len(pool)]
+        pending[worker.submit(_search, moves, depth, alpha, beta, end_time)] = task
+
+    def collect(self, future):
+        """
+        Reads a finished search and adds its counters to the move's totals.
+
+        Parameters:
+        - future: The future of a _search call.
+
+        Returns:
+        - The score, or None if the search ran out of time.
+        """
+        score, nodes, hits, lookups = future.result()
+        self._counts[0] += nodes
+        self._counts[1] += hits
+        self._counts[2] += lookups
+        return score
+
+    def search_root(self, pool, board, depth, first_move, end_time):
+        """
+        Searches every move of the root position to a fixed depth across the workers.
+
+        Parameters:
+        - pool: The list of worker pools.
+        - board: The BitBoard of the root position. No root move may win at once.
+        - depth: The number of plies to search.
+        - first_move: The column searched first to set alpha (optional).
+        - end_time: The time.time() value at which the search must stop.
+
+        Returns:
+        - A (score, column) tuple for the best move, or None if the search ran out of time.
+        """
+        moves = list(board.moves)
+        order = NegamaxAI.ordered_moves(board, first_move)
+        pending = {}
+        self.submit(pool, pending, ("full", order[0], None, -WIN_SCORE), moves + [order[0]], depth - 1,
+                    -WIN_SCORE, WIN_SCORE, end_time)
+        alpha, best_move = None, order[0]
+        # For each root move split by reply: the replies not yet tested, and whether one refuted the move.
+        replies = {}
+        refuted = set()
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                kind, col, reply, tested = pending.pop(future)
+                score = self.collect(future)
+                if score is None:
+                    for other in pending:
+                        other.cancel()
+                    wait(pending)
+                    return None
+                child = moves + [col]
+
+                if kind == "full":
+                    if alpha is None:
+                        alpha = -score
+                        for sibling in order[1:]:
+                            self.test(pool, pending, board, sibling, depth, alpha, replies, end_time)
+                    elif -score > alpha:
+                        alpha, best_move = -score, col
+                elif kind == "test":
+                    if -score > tested:
+                        self.submit(pool, pending, ("full", col, None, alpha), child, depth - 1,
+                                    -WIN_SCORE, -alpha, end_time)
+                elif col not in refuted:
+                    # A reply test scores the position after the reply for the root player.
+                    if score <= tested:
+                        refuted.add(col)
+                        for other, task in pending.items():
+                            if task[1] == col:
+                                other.cancel()
+                    elif kind == "first":
+                        for other_reply in replies[col]:
+                            self.submit(pool, pending, ("reply", col, other_reply, alpha),
+                                        child + [other_reply], depth - 2, alpha, alpha + 1, end_time)
+                        replies[col] = []
+                    if col not in refuted and not any(task[1] == col for task in pending.values()):
+                        # Every reply failed to refute the move, so it beats alpha: find its score.
+                        self.submit(pool, pending, ("full", col, None, alpha), child, depth - 1,
+                                    -WIN_SCORE, -alpha, end_time)
+            for future in [future for future, task in pending.items() if future.cancelled()]:
+                del pending[future]
+        return alpha, best_move
+
+    def test(self, pool, pending, board, col, depth, alpha, replies, end_time):
+        """
+        Starts testing whether a root move beats alpha, split by reply when it is deep enough.
+
+        Parameters:
+        - pool: The list of worker pools.
+        - pending: The dict of running futures.
+        - board: The BitBoard of the root position.
+        - col: The root move to test.
+        - depth: The depth of the root search.
+        - alpha: The score of the best root move so far.
+        - replies: The dict of untested replies per split root move, which is filled in.
+        - end_time: The time.time() value at which the search must stop.
+        """
+        moves = list(board.moves) + [col]
+        if depth >= SPLIT_DEPTH:
+            board.play(col)
+            opponent = board.pieces[len(board.moves) & 1]
+            # Positions with an immediate win for the opponent are left whole, where negamax sees the win.
+            order = [] if any(BitBoard.has_four(opponent | 1 << (c * BitBoard.HEIGHT + board.heights[c]))
+                              for c in NegamaxAI.ordered_moves(board)) else NegamaxAI.ordered_moves(board)
+            board.undo()
+            if order:
+                replies[col] = order[1:]
+                self.submit(pool, pending, ("first", col, order[0], alpha), moves + [order[0]], depth - 2,
+                            alpha, alpha + 1, end_time)
+                return
+        self.submit(pool, pending, ("test", col, None, alpha), moves, depth - 1, -alpha - 1, -alpha, end_time)
@@ -0,0 +1,269 @@
+import threading
+from Logic.bitboard import BitBoard
+from Logic.negamax import CELLS, CENTER_ORDER, WIN_SCORE, NegamaxAI, SearchTimeout
+
+
+class Ponderer:
+    """
+    Class that analyses a position on a background thread while a human player thinks.
+
+    For the human's position, every reply position (one per column the human
+    can play) is searched to increasing depths, round after round. After each
+    round the best column for the human and its score are published as a
+    hint, and the result for each reply position is kept so the computer can
+    answer at once once the human has moved. A new position interrupts the
+    current search and drops the results that no longer apply; the
+    transposition table, which may be shared with the computer player, keeps
+    everything searched so far.
+    """
+
+    def __init__(self, table=None, max_depth=CELLS, on_update=None):
+        """
+        Starts the analysis thread, idle until a position is given.
+
+        Parameters:
+        - table: The TranspositionTable to search with (optional). Pass the computer player's
+          table so both searches reuse each other's work. A new one is created if omitted.
+        - max_depth: The deepest round searched.
+        - on_update: A function called from the analysis thread whenever a new hint is published (optional).
+        """
+        self.searcher = NegamaxAI(time_limit=float("inf"), max_depth=max_depth, table=table)
+        self.max_depth = max_depth
+        self.on_update = on_update
+        self.condition = threading.Condition()
+        self.pending = None
+        self.generation = 0
+        self.searching = False
+        self.closed = False
+        self.results = {}
+        self.hint = None
+        self.thread = threading.Thread(target=self.run, name="ponder", daemon=True)
+        self.thread.start()
+
+    def analyse(self, moves):
+        """
+        Starts analysing a position, dropping the analysis of the previous one.
+
+        Parameters:
+        - moves: The columns played so far. The player to move is the one the hint is for.
+        """
+        with self.condition:
+            self.interrupt()
+            self.pending = list(moves)
+            self.results = {}
+            self.hint = None
+            self.condition.notify_all()
+
+    def pause(self):
+        """
+        Stops the current analysis and waits until the thread is idle. The
+        published results are kept.
+        """
+        with self.condition:
+            self.interrupt()
+            self.pending = None
+            while self.searching:
+                self.condition.wait()
+
+    def interrupt(self):
+        """
+        Makes the running search stop at its next deadline check. The caller must hold the condition.
+        """
+        self.generation += 1
+        self.searcher.stop()
+
+    def close(self):
+        """
+        Stops the analysis thread.
+        """
+        with self.condition:
+            self.interrupt()
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+
+    def reply(self, moves):
+        """
+        Looks up the analysis of a reply position.
+
+        Parameters:
+        - moves: The columns played so far, ending with the human's move.
+
+        Returns:
+        - A (depth, score, best_move) tuple for the player to move, or None if the position was not analysed.
+        """
+        with self.condition:
+            return self.results.get(tuple(moves))
+
+    def latest_hint(self, moves):
+        """
+        Returns the hint for a position.
+
+        Parameters:
+        - moves: The columns played so far.
+
+        Returns:
+        - A dict with the best "column", its "score" for the player to move and the
+          "depth" searched, or None if no hint is ready for this position.
+        """
+        with self.condition:
+            if self.hint is not None and self.hint["moves"] == list(moves):
+                return self.hint
+            return None
+
+    def run(self):
+        """
+        Waits for positions to analyse until close() is called.
+        """
+        while True:
+            with self.condition:
+                self.searching = False
+                self.condition.notify_all()
+                while not self.closed and self.pending is None:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                moves, generation = self.pending, self.generation
+                self.pending = None
+                self.searching = True
+            self.ponder(moves, generation)
+
+    def ponder(self, moves, generation):
+        """
+        Searches the reply positions of a position round after round until they
+        are solved, max_depth is reached or the analysis is interrupted.
+
+        Parameters:
+        - moves: The columns played so far.
+        - generation: The generation the analysis belongs to. It stops as soon as the generation changes.
+        """
+        board = BitBoard.from_moves(moves)
+        played = len(moves)
+        me = board.pieces[played & 1]
+        scores = {}
+        replies = []
+        for col in CENTER_ORDER:
+            if board.heights[col] == BitBoard.ROWS:
+                continue
+            if BitBoard.has_four(me | 1 << (col * BitBoard.HEIGHT + board.heights[col])):
+                scores[col] = WIN_SCORE - played
+            elif played + 1 == CELLS:
+                scores[col] = 0
+            else:
+                replies.append(col)
+        best_moves = {}
+
+        for depth in range(1, min(self.max_depth, CELLS - played - 1) + 1):
+            for col in replies:
+                if abs(scores.get(col, 0)) >= WIN_SCORE - CELLS:
+                    continue
+                reply = BitBoard.from_moves(moves + [col])
+                with self.condition:
+                    if self.generation != generation:
+                        return
+                    self.searcher.set_deadline(float("inf"))
+                try:
+                    score, best_move = self.searcher.search_root(reply, depth, -WIN_SCORE, WIN_SCORE,
+                                                                 best_moves.get(col))
+                except SearchTimeout:
+                    return
+                best_moves[col] = best_move
+                scores[col] = -score
+                with self.condition:
+                    if self.generation != generation:
+                        return
+                    self.results[tuple(moves) + (col,)] = (depth, score, best_move)
+            if not self.publish(moves, generation, scores, depth + 1):
+                return
+            if all(abs(score) >= WIN_SCORE - CELLS for score in scores.values()):
+                break
+        if not replies:
+            self.publish(moves, generation, scores, 1)
+
+    def publish(self, moves, generation, scores, depth):
+        """
+        Publishes the best column found so far as the hint.
+
+        Parameters:
+        - moves: The columns played so far.
+        - generation: The generation the analysis belongs to.
+        - scores: The score of each column for the player to move.
+        - depth: The depth the scores were searched to, counting the player's own move.
+
+        Returns:
+        - True if the hint was published, False if the analysis is stale.
+        """
+        column = max(scores, key=scores.get)
+        with self.condition:
+            if self.generation != generation:
+                return False
+            self.hint = {"moves": list(moves), "column": column, "score": scores[column], "depth": depth}
+        if self.on_update is not None:
+            self.on_update()
+        return True
+
+
+class PonderingPlayer:
+    """
+    Computer player that answers at once when the Ponderer has already searched
+    the position deeply enough, and asks another player otherwise.
+
+    Deep enough means at least as deep as the other player's last search that
+    ran out of time, which is the depth its budget reaches. Searches cut short
+    by a forced win say nothing about the budget and are ignored, and the depth
+    is forgotten at the start of every game, so until the player has run out of
+    time once in the game only solved positions are answered from the analysis.
+    """
+
+    def __init__(self, player, ponderer):
+        """
+        Initializes the player.
+
+        Parameters:
+        - player: The computer player used when the analysis is missing or too shallow.
+        - ponderer: The Ponderer analysing the human's positions.
+        """
+        self.player = player
+        self.ponderer = ponderer
+        self.depth = 0
+        self.stats = {}
+
+    def choose_move(self, board):
+        """
+        Picks a column for the player to move.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        self.ponderer.pause()
+        result = self.ponderer.reply(board.moves)
+        if result is not None:
+            depth, score, move = result
+            # Only trust the analysis if it is at least as deep as the player's own last search.
+            if abs(score) >= WIN_SCORE - CELLS or (self.depth and depth >= self.depth):
+                self.stats = {"pondered": True, "depth": depth, "score": score}
+                return move
+        move = self.player.choose_move(board)
+        self.stats = dict(self.player.stats, pondered=False)
+        if self.stats.get("timed_out") and self.stats.get("depth"):
+            self.depth = self.stats["depth"]
+        return move
+
+    def new_game(self):
+        """
+        Forgets the search depth of the previous game, here and in the wrapped player.
+        """
+        self.depth = 0
+        if hasattr(self.player, "new_game"):
+            self.player.new_game()
+
+    def close(self):
+        """
+        Stops the analysis thread and closes the wrapped player.
+        """
+        self.ponderer.close()
+        if hasattr(self.player, "close"):
+            self.player.close()
@@ -0,0 +1,219 @@
+import heapq
+import json
+import os
+import queue
+import threading
+import time
+
+
+WIN, LOSS, DRAW = 0, 1, 2
+
+
+class Scoreboard:
+    """
+    Class that keeps win, loss and draw totals per player.
+
+    Every game is appended as one tab-separated line (time, player 1, player 2,
+    winner) to a log file, and the totals are kept in an in-memory index, so
+    queries never touch the disk. Lines are written in batches by a background
+    thread, so recording a game never waits for the file. The index is saved
+    next to the log from time to time with the log offset it covers, and on
+    startup only the lines written after that offset are read back.
+    """
+
+    def __init__(self, path="high_score.txt", flush_delay=0.05, checkpoint_every=10_000):
+        """
+        Loads the index and starts the writer thread.
+
+        Parameters:
+        - path: The log file.
+        - flush_delay: How long the writer waits for more games before writing a batch, in seconds.
+        - checkpoint_every: The number of games written between two saves of the index.
+        """
+        self.path = path
+        self.index_path = path + ".idx"
+        self.flush_delay = flush_delay
+        self.checkpoint_every = checkpoint_every
+        self.totals = {}
+        self.games = 0
+        # The totals of the games already in the log, which is what a saved index must match.
+        self.written_totals = {}
+        self.written_games = 0
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.offset = self.load()
+        self.thread = threading.Thread(target=self.write_loop, name="scoreboard", daemon=True)
+        self.thread.start()
+
+    def load(self):
+        """
+        Rebuilds the index from the last saved index and the lines logged after it.
+        Lines that do not hold a valid game, such as a line cut short by a crash,
+        are skipped.
+
+        Returns:
+        - The size of the log file.
+        """
+        offset = 0
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        # A log that does not end with a newline gets one before the next line is appended.
+        self.needs_newline = False
+        if size:
+            with open(self.path, "rb") as log:
+                log.seek(size - 1)
+                self.needs_newline = log.read(1) != b"\n"
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as index_file:
+                saved = json.load(index_file)
+            if saved["offset"] <= size:
+                offset = saved["offset"]
+                self.games = saved["games"]
+                self.totals = saved["totals"]
+        if offset < size:
+            with open(self.path, "rb") as log:
+                log.seek(offset)
+                for line in log:
+                    game = self.parse(line)
+                    if game is not None:
+                        self.games += 1
+                        self.count(self.totals, *game)
+        self.written_games = self.games
+        self.written_totals = {name: list(totals) for name, totals in self.totals.items()}
+        return size
+
+    @staticmethod
+    def parse(line):
+        """
+        Reads one log line.
+
+        Parameters:
+        - line: The line, as bytes.
+
+        Returns:
+        - A (player1, player2, winner) tuple, or None if the line does not hold a valid game.
+        """
+        fields = line.decode("utf-8", "replace").rstrip("\n").split("\t")
+        if len(fields) != 4 or not fields[0].isdigit() or fields[3] not in ("0", "1", "2"):
+            return None
+        return fields[1], fields[2], int(fields[3])
+
+    @staticmethod
+    def count(totals, player1, player2, winner):
+        """
+        Adds one game to a totals index.
+
+        Parameters:
+        - totals: The index, mapping each name to a [wins, losses, draws] list.
+        - player1: The name of the player who moved first.
+        - player2: The name of the other player.
+        - winner: The winning player (1 or 2), or 0 for a draw.
+        """
+        first = totals.setdefault(player1, [0, 0, 0])
+        second = totals.setdefault(player2, [0, 0, 0])
+        if winner == 1:
+            first[WIN] += 1
+            second[LOSS] += 1
+        elif winner == 2:
+            first[LOSS] += 1
+            second[WIN] += 1
+        else:
+            first[DRAW] += 1
+            second[DRAW] += 1
+
+    def record(self, player1, player2, winner):
+        """
+        Records a finished game. The index is updated at once and the log line
+        is queued for the writer thread.
+
+        Parameters:
+        - player1: The name of the player who moved first.
+        - player2: The name of the other player.
+        - winner: The winning player (1 or 2), or 0 for a draw.
+        """
+        player1 = " ".join(player1.split())
+        player2 = " ".join(player2.split())
+        with self.lock:
+            self.games += 1
+            self.count(self.totals, player1, player2, winner)
+        self.queue.put((time.time(), player1, player2, winner))
+
+    def write_loop(self):
+        """
+        Writes queued games to the log in batches until close() is called.
+        """
+        written = 0
+        with open(self.path, "ab") as log:
+            while True:
+                batch = [self.queue.get()]
+                time.sleep(self.flush_delay)
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in batch
+                games = [game for game in batch if game is not None]
+                data = "".join(f"{timestamp:.0f}\t{player1}\t{player2}\t{winner}\n"
+                               for timestamp, player1, player2, winner in games).encode("utf-8")
+                if data and self.needs_newline:
+                    data = b"\n" + data
+                    self.needs_newline = False
+                log.write(data)
+                log.flush()
+                self.offset += len(data)
+                self.written_games += len(games)
+                for _, player1, player2, winner in games:
+                    self.count(self.written_totals, player1, player2, winner)
+                written += len(games)
+                if stop or written >= self.checkpoint_every:
+                    self.checkpoint()
+                    written = 0
+                if stop:
+                    return
+
+    def checkpoint(self):
+        """
+        Saves the totals of the games in the log with the log offset they cover.
+        Only called from the writer thread.
+        """
+        saved = json.dumps({"offset": self.offset, "games": self.written_games, "totals": self.written_totals})
+        temporary = self.index_path + ".tmp"
+        with open(temporary, "w") as index_file:
+            index_file.write(saved)
+        os.replace(temporary, self.index_path)
+
+    def close(self):
+        """
+        Writes the pending games, saves the index and stops the writer thread.
+        """
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def player(self, name):
+        """
+        Looks up a player's totals.
+
+        Parameters:
+        - name: The player's name.
+
+        Returns:
+        - A dict with the player's "wins", "losses" and "draws".
+        """
+        with self.lock:
+            wins, losses, draws = self.totals.get(name, (0, 0, 0))
+        return {"wins": wins, "losses": losses, "draws": draws}
+
+    def top(self, n=10):
+        """
+        Ranks the players by wins, then by fewest losses.
+
+        Parameters:
+        - n: The number of players to return.
+
+        Returns:
+        - A list of (name, wins, losses, draws) tuples, best first.
+        """
+        with self.lock:
+            best = heapq.nlargest(n, self.totals.items(), key=lambda item: (item[1][WIN], -item[1][LOSS]))
+        return [(name, *totals) for name, totals in best]
@@ -0,0 +1,368 @@
+import json
+import math
+import os
+import random
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from Logic.board import Board
+from Logic.mcts import MCTSAI
+from Logic.negamax import NegamaxAI, TranspositionTable
+
+
+ENGINES = ("negamax", "mcts", "random")
+
+
+class RandomPlayer:
+    """
+    Computer player that plays a random legal column. Useful as a baseline in tournaments.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializes the player.
+
+        Parameters:
+        - seed: The seed of the random number generator (optional).
+        """
+        self.random = random.Random(seed)
+        self.stats = {}
+
+    def choose_move(self, board):
+        """
+        Picks a random legal column.
+
+        Parameters:
+        - board: A Board or BitBoard with at least one legal move.
+
+        Returns:
+        - The column to play.
+        """
+        return self.random.choice(board.legal_moves())
+
+
+def parse_player(spec):
+    """
+    Parses a player configuration written as name=engine:key=value,key=value.
+
+    For example "fast=negamax:time=0.05,depth=6" or "uct=mcts:playouts=2000".
+    The keys are time, depth and table for negamax; time, playouts, exploration
+    and seed for mcts; seed for random.
+
+    Parameters:
+    - spec: The configuration string.
+
+    Returns:
+    - A (name, config) tuple, where config is a dict holding "engine" and the settings.
+    """
+    name, _, rest = spec.partition("=")
+    engine, _, settings = rest.partition(":")
+    if not name or engine not in ENGINES:
+        raise ValueError(f"bad player {spec!r}: expected name=engine[:key=value,...] with engine in {ENGINES}")
+    config = {"engine": engine}
+    for setting in filter(None, settings.split(",")):
+        key, _, value = setting.partition("=")
+        config[key] = float(value) if key in ("time", "exploration") else int(value)
+    return name, config
+
+
+def create_player(config, game_id=0):
+    """
+    Creates a computer player from its configuration.
+
+    Parameters:
+    - config: A dict as returned by parse_player.
+    - game_id: The game the player is created for. It is added to the configured
+      seed, so every game gets its own but repeatable random moves.
+
+    Returns:
+    - The computer player.
+    """
+    seed = config["seed"] + game_id if "seed" in config else None
+    if config["engine"] == "negamax":
+        return NegamaxAI(time_limit=config.get("time", 0.1), max_depth=config.get("depth", 42),
+                         table=TranspositionTable(config.get("table", 1 << 20)))
+    if config["engine"] == "mcts":
+        return MCTSAI(time_limit=config.get("time", 0.1), playouts=config.get("playouts"),
+                      exploration=config.get("exploration", 1.4), seed=seed)
+    return RandomPlayer(seed)
+
+
+def schedule(names, mode="round-robin", rounds=1, opening_plies=2, seed=0):
+    """
+    Lists the games of a tournament in a fixed order, so a stopped run can be resumed.
+
+    Each pairing plays every opening twice, once with each player moving first.
+
+    Parameters:
+    - names: The player names. In gauntlet mode the first one plays all the others.
+    - mode: "round-robin" or "gauntlet".
+    - rounds: The number of openings per pairing.
+    - opening_plies: The number of random moves played before the players take over.
+    - seed: The seed the openings are drawn from.
+
+    Returns:
+    - A list of game dicts with "id", "first", "second" and "opening".
+    """
+    if mode == "gauntlet":
+        pairings = [(names[0], other) for other in names[1:]]
+    else:
+        pairings = [(a, b) for i, a in enumerate(names) for b in names[i + 1:]]
+    rng = random.Random(seed)
+    games = []
+    for round_index in range(rounds):
+        for a, b in pairings:
+            opening = random_opening(rng, opening_plies)
+            for first, second in ((a, b), (b, a)):
+                games.append({"id": len(games), "round": round_index, "first": first, "second": second,
+                              "opening": opening})
+    return games
+
+
+def random_opening(rng, plies):
+    """
+    Plays random moves from the empty board, avoiding moves that win.
+
+    Parameters:
+    - rng: The random number generator.
+    - plies: The number of moves.
+
+    Returns:
+    - The list of columns played.
+    """
+    board = Board()
+    for _ in range(plies):
+        col = rng.choice(board.legal_moves())
+        row = board.play(col)
+        if board.winning_cells(row, col, board.board[row][col]):
+            board.undo()
+            break
+    return list(board.moves)
+
+
+_configs = {}
+
+
+def _init_worker(configs):
+    """
+    Stores the player configurations in a pool worker. Ctrl-C is left to the
+    parent process, which stops handing out games.
+
+    Parameters:
+    - configs: A dict mapping each player name to its configuration.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _configs.update(configs)
+
+
+def play_game(game):
+    """
+    Plays one tournament game headless on the Board rules. The players are
+    created afresh for every game, so a game's outcome does not depend on which
+    worker played it or what that worker played before, only on the time limits.
+
+    Parameters:
+    - game: A game dict as returned by schedule.
+
+    Returns:
+    - The game dict, completed with "result" (1 if the first player won, 2 if
+      the second did, 0 for a draw), "moves", "reason" and "seconds".
+    """
+    start = time.perf_counter()
+    players = [create_player(_configs[name], game["id"]) for name in (game["first"], game["second"])]
+
+    board = Board()
+    for col in game["opening"]:
+        board.play(col)
+    # The first player takes over the pieces of the side to move after the opening.
+    first_piece = board.current_piece()
+    result, reason = 0, "draw"
+    while not board.is_draw():
+        piece = board.current_piece()
+        seat = 1 if piece == first_piece else 2
+        col = players[seat - 1].choose_move(board)
+        if col not in board.legal_moves():
+            result, reason = 3 - seat, "illegal move"
+            break
+        row = board.play(col)
+        if board.winning_cells(row, col, piece):
+            result, reason = seat, "win"
+            break
+    return dict(game, result=result, reason=reason, moves=list(board.moves),
+                seconds=time.perf_counter() - start)
+
+
+class EloTable:
+    """
+    Class that keeps the pairwise results of a tournament and fits Elo ratings to them.
+
+    Results are added one game at a time. ratings() fits a Bradley-Terry model,
+    starting from the previous fit so each update only takes a few iterations,
+    and gives each rating a 95% confidence interval from the curvature of the
+    likelihood. Draws count as half a win. Every player also gets one virtual
+    draw against a 0-rated opponent, which keeps the ratings finite for players
+    who won or lost every game.
+    """
+
+    def __init__(self, names):
+        """
+        Initializes an empty table.
+
+        Parameters:
+        - names: The player names.
+        """
+        self.names = list(names)
+        self.points = {name: 0.0 for name in self.names}
+        self.games = {}
+        self.totals = {name: [0, 0, 0] for name in self.names}
+        self.strength = {name: 1.0 for name in self.names}
+
+    def add(self, first, second, result):
+        """
+        Adds one game.
+
+        Parameters:
+        - first: The name of the player who moved first.
+        - second: The name of the other player.
+        - result: 1 if the first player won, 2 if the second did, 0 for a draw.
+        """
+        pair = (first, second) if first < second else (second, first)
+        self.games[pair] = self.games.get(pair, 0) + 1
+        if result == 0:
+            self.points[first] += 0.5
+            self.points[second] += 0.5
+            self.totals[first][1] += 1
+            self.totals[second][1] += 1
+        else:
+            winner, loser = (first, second) if result == 1 else (second, first)
+            self.points[winner] += 1
+            self.totals[winner][0] += 1
+            self.totals[loser][2] += 1
+
+    def opponents(self, name):
+        """
+        Lists the opponents a player has met.
+
+        Parameters:
+        - name: The player's name.
+
+        Returns:
+        - A list of (opponent, games) tuples.
+        """
+        return [(b if a == name else a, count) for (a, b), count in self.games.items() if name in (a, b)]
+
+    def ratings(self, iterations=50, tolerance=1e-6):
+        """
+        Fits the ratings to the results so far.
+
+        Parameters:
+        - iterations: The maximum number of update rounds.
+        - tolerance: The relative change below which the fit stops early.
+
+        Returns:
+        - A dict mapping each name to an (elo, interval) tuple, where the rating is
+          elo plus or minus interval with 95% confidence. Ratings average to 0.
+        """
+        strength = self.strength
+        for _ in range(iterations):
+            change = 0.0
+            for name in self.names:
+                # Minorization-maximization update, with the virtual draw against strength 1.
+                denominator = 1 / (strength[name] + 1)
+                for opponent, count in self.opponents(name):
+                    denominator += count / (strength[name] + strength[opponent])
+                updated = (self.points[name] + 0.5) / denominator
+                change = max(change, abs(updated / strength[name] - 1))
+                strength[name] = updated
+            if change < tolerance:
+                break
+        scale = 400 / math.log(10)
+        mean = sum(math.log(value) for value in strength.values()) / len(strength)
+        ratings = {}
+        for name in self.names:
+            own = strength[name]
+            information = own / (own + 1) ** 2
+            for opponent, count in self.opponents(name):
+                information += count * own * strength[opponent] / (own + strength[opponent]) ** 2
+            ratings[name] = (scale * (math.log(own) - mean), 1.96 * scale / math.sqrt(information))
+        return ratings
+
+    def standings(self):
+        """
+        Returns:
+        - A list of (name, elo, interval, wins, draws, losses) tuples, best first.
+        """
+        ratings = self.ratings()
+        return sorted(((name, *ratings[name], *self.totals[name]) for name in self.names),
+                      key=lambda row: -row[1])
+
+
+def run_tournament(players, results_path, mode="round-robin", rounds=1, opening_plies=2, seed=0,
+                   workers=None, on_game=None):
+    """
+    Plays the games of a tournament across a process pool, appending each
+    result to a JSON lines file as soon as it finishes. Games already in the
+    file are skipped, so a stopped run picks up where it left off.
+
+    Parameters:
+    - players: A dict mapping each player name to its configuration, in tournament order.
+    - results_path: The JSON lines file the results are appended to.
+    - mode: "round-robin" or "gauntlet".
+    - rounds: The number of openings per pairing.
+    - opening_plies: The number of random moves played before the players take over.
+    - seed: The seed the openings are drawn from.
+    - workers: The number of worker processes (optional). Defaults to the number of CPUs.
+    - on_game: A function called with each finished game and the EloTable (optional).
+
+    Returns:
+    - The EloTable holding every result.
+    """
+    header = {"type": "tournament", "players": players, "mode": mode, "rounds": rounds,
+              "opening_plies": opening_plies, "seed": seed}
+    table = EloTable(players)
+    done = set()
+    has_header = False
+    if os.path.exists(results_path):
+        with open(results_path) as results:
+            for line in results:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("type") == "tournament":
+                    # More rounds may be added to a finished run; everything else must match.
+                    if any(record.get(key) != value for key, value in header.items() if key != "rounds"):
+                        raise ValueError(f"{results_path} holds results for a different tournament")
+                    has_header = True
+                elif "id" in record and record["id"] not in done:
+                    done.add(record["id"])
+                    table.add(record["first"], record["second"], record["result"])
+
+    games = [game for game in schedule(list(players), mode, rounds, opening_plies, seed) if game["id"] not in done]
+    with open(results_path, "a") as results, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(players,)) as pool:
+        if not has_header:
+            results.write(json.dumps(header) + "\n")
+            results.flush()
+        pending = set()
+        queue = iter(games)
+        limit = 2 * (workers or os.cpu_count() or 1)
+        try:
+            while True:
+                for game in queue:
+                    pending.add(pool.submit(play_game, game))
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    break
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    game = future.result()
+                    results.write(json.dumps(game) + "\n")
+                    results.flush()
+                    table.add(game["first"], game["second"], game["result"])
+                    if on_game is not None:
+                        on_game(game, table)
+        except KeyboardInterrupt:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    return table
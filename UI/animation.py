@@ -0,0 +1,75 @@
+from collections import deque
+
+
+class Animator:
+    """
+    Class that plays frame-driven animations without blocking the event loop.
+
+    An animation is a generator that draws one frame each time it is advanced
+    and yields how many milliseconds that frame should stay on screen.
+    Animations are played one after the other, in the order they were started.
+    """
+
+    def __init__(self, skip=False):
+        """
+        Initializes an idle animator.
+
+        Parameters:
+        - skip: If True, animations are dropped as soon as they are started and
+          only their completion callbacks run.
+        """
+        self.skip = skip
+        self.queue = deque()
+        self.current = None
+        self.remaining = 0
+
+    def start(self, frames, on_done=None):
+        """
+        Queues an animation.
+
+        Parameters:
+        - frames: The animation generator.
+        - on_done: A function called once the animation has finished (optional).
+        """
+        if self.skip:
+            frames.close()
+            if on_done:
+                on_done()
+            return
+        self.queue.append((frames, on_done))
+
+    def busy(self):
+        """
+        Returns:
+        - True if an animation is playing or queued, False otherwise.
+        """
+        return self.current is not None or bool(self.queue)
+
+    def update(self, elapsed):
+        """
+        Advances the animations by the time elapsed since the last frame.
+
+        Parameters:
+        - elapsed: The number of milliseconds since the previous call.
+        """
+        if self.current is None:
+            if not self.queue:
+                return
+            # A fresh animation shows its first frame right away, however long the animator was idle.
+            self.remaining = 0
+        else:
+            self.remaining -= elapsed
+
+        while self.remaining <= 0:
+            if self.current is None:
+                if not self.queue:
+                    self.remaining = 0
+                    return
+                self.current = self.queue.popleft()
+            frames, on_done = self.current
+            try:
+                self.remaining += next(frames)
+            except StopIteration:
+                self.current = None
+                if on_done:
+                    on_done()
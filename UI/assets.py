@@ -0,0 +1,147 @@
+import time
+import pygame
+
+
+class LazySound:
+    """
+    Sound that is only loaded and decoded the first time it is played.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the sound without loading it.
+
+        Parameters:
+        - path: The path of the sound file.
+        """
+        self.path = path
+        self.sound = None
+        self.failed = False
+
+    def play(self):
+        """
+        Plays the sound, loading it first if needed. A sound that fails to load stays silent.
+        """
+        if self.sound is None and not self.failed:
+            try:
+                self.sound = pygame.mixer.Sound(self.path)
+            except pygame.error:
+                print(f"Sound file not found! Ensure '{self.path}' exists.")
+                self.failed = True
+        if self.sound is not None:
+            self.sound.play()
+
+
+class AssetManager:
+    """
+    Class that loads every image, font and sound once and hands out the cached copy.
+
+    Images are converted to the display format and scaled once per requested
+    size, and static text is rendered once per string, size and colour.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty caches.
+        """
+        self.images = {}
+        self.fonts = {}
+        self.texts = {}
+        self.sounds = {}
+        self.load_seconds = 0.0
+        self.loads = 0
+        self.hits = 0
+
+    def image(self, path, size=None):
+        """
+        Returns an image, converted to the display format and optionally scaled.
+
+        Parameters:
+        - path: The path of the image file.
+        - size: The (width, height) to scale the image to (optional).
+
+        Returns:
+        - The cached pygame surface.
+        """
+        key = (path, size)
+        surface = self.images.get(key)
+        if surface is None:
+            start = time.perf_counter()
+            surface = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            self.images[key] = surface
+            self.loaded(start)
+        else:
+            self.hits += 1
+        return surface
+
+    def font(self, size):
+        """
+        Returns the default font at a given size.
+
+        Parameters:
+        - size: The font size.
+
+        Returns:
+        - The cached pygame font.
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            start = time.perf_counter()
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+            self.loaded(start)
+        else:
+            self.hits += 1
+        return font
+
+    def text(self, text, size, color=(255, 255, 255)):
+        """
+        Returns a line of text rendered with the default font. Meant for fixed labels:
+        every distinct text stays cached, so render changing text with font() instead.
+
+        Parameters:
+        - text: The text to render.
+        - size: The font size.
+        - color: The text colour.
+
+        Returns:
+        - The cached pygame surface.
+        """
+        key = (text, size, color)
+        surface = self.texts.get(key)
+        if surface is None:
+            surface = self.font(size).render(text, True, color)
+            self.texts[key] = surface
+        else:
+            self.hits += 1
+        return surface
+
+    def sound(self, path):
+        """
+        Returns a sound that is decoded the first time it is played.
+
+        Parameters:
+        - path: The path of the sound file.
+
+        Returns:
+        - The cached LazySound.
+        """
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = LazySound(path)
+            self.sounds[path] = sound
+        return sound
+
+    def loaded(self, start):
+        """
+        Records the time spent loading one asset.
+
+        Parameters:
+        - start: The time.perf_counter() value when loading started.
+        """
+        self.load_seconds += time.perf_counter() - start
+        self.loads += 1
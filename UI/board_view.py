@@ -0,0 +1,261 @@
+import pygame
+from Logic.board import Board
+
+
+class BoardView:
+    """
+    Class that draws a Board and its animations with pygame.
+
+    The blue grid and the piece sprites are rendered once per process and
+    board size, and the current board is kept as one pre-rendered surface.
+    When a piece is added, only its cell is redrawn on that surface; it is
+    rebuilt in full after any other change.
+
+    Boards larger than the standard one, such as a ConnectKBoard, are drawn
+    with smaller squares so they fit on the screen.
+    """
+    ROWS = Board.ROWS
+    COLS = Board.COLS
+    SQUARESIZE = 100
+    RADIUS = SQUARESIZE // 2 - 5
+    PIECE_COLORS = {1: (255, 0, 0), 2: (255, 255, 0)}
+
+    _grids = {}
+    _sprites = {}
+
+    def __init__(self, board, size=None):
+        """
+        Initializes the view of a board.
+
+        Parameters:
+        - board: The Board or ConnectKBoard to draw.
+        - size: The (width, height) of the screen area available (optional). When given,
+          the squares shrink from SQUARESIZE as needed to fit the board and the free row above it.
+        """
+        self.board = board
+        self.ROWS = board.ROWS
+        self.COLS = board.COLS
+        if size is not None:
+            self.SQUARESIZE = min(BoardView.SQUARESIZE, size[0] // self.COLS, size[1] // (self.ROWS + 1))
+            self.RADIUS = self.SQUARESIZE // 2 - max(1, self.SQUARESIZE // 20)
+        self._surface = None
+        self._surface_moves = None
+
+    def draw(self, screen):
+        """
+        Draws the board on the screen.
+
+        Parameters:
+        - screen: The pygame screen surface where the board will be drawn.
+
+        Returns:
+        - The pygame.Rect of the screen area that was drawn.
+        """
+        return screen.blit(self.board_surface(), (0, self.SQUARESIZE))
+
+    def board_surface(self):
+        """
+        Returns the current board, pre-rendered. After one new piece only its
+        cell is redrawn, and the surface is rebuilt after any other change.
+
+        Returns:
+        - A surface holding the grid and every piece on it.
+        """
+        moves = self.board.moves
+        if self._surface is not None and self._surface_moves == moves:
+            return self._surface
+        if self._surface is not None and len(moves) == len(self._surface_moves) + 1 and \
+                moves[:-1] == self._surface_moves:
+            col = moves[-1]
+            self.draw_cell(self._surface, self.ROWS - self.board.heights[col], col)
+            self._surface_moves.append(col)
+            return self._surface
+        surface = pygame.Surface((self.COLS * self.SQUARESIZE, self.ROWS * self.SQUARESIZE))
+        surface = self.convert(surface, alpha=False)
+        surface.fill((0, 0, 0))
+        for c in range(self.COLS):
+            for r in range(self.ROWS - self.board.heights[c], self.ROWS):
+                surface.blit(self.sprite(self.PIECE_COLORS[self.board.piece_at(r, c)]),
+                             (c * self.SQUARESIZE, r * self.SQUARESIZE))
+        surface.blit(self.grid_surface(), (0, 0))
+        self._surface = surface
+        self._surface_moves = list(moves)
+        return self._surface
+
+    def draw_cell(self, surface, row, col):
+        """
+        Redraws one cell of the pre-rendered board.
+
+        Parameters:
+        - surface: The board surface.
+        - row: The row of the cell.
+        - col: The column of the cell.
+        """
+        area = pygame.Rect(col * self.SQUARESIZE, row * self.SQUARESIZE, self.SQUARESIZE, self.SQUARESIZE)
+        surface.fill((0, 0, 0), area)
+        piece = self.board.piece_at(row, col)
+        if piece:
+            surface.blit(self.sprite(self.PIECE_COLORS[piece]), area.topleft)
+        surface.blit(self.grid_surface(), area.topleft, area)
+
+    @staticmethod
+    def convert(surface, alpha=True):
+        """
+        Converts a surface to the display format when a display is open.
+
+        Parameters:
+        - surface: The surface to convert.
+        - alpha: Whether the surface has per-pixel transparency.
+
+        Returns:
+        - The converted surface, or the surface itself if no display is open.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def grid_surface(self):
+        """
+        Returns the blue grid with transparent holes, rendered on first use for each board size.
+
+        Returns:
+        - A surface the size of the board.
+        """
+        key = (self.ROWS, self.COLS, self.SQUARESIZE, self.RADIUS)
+        grid = self._grids.get(key)
+        if grid is None:
+            grid = pygame.Surface((self.COLS * self.SQUARESIZE, self.ROWS * self.SQUARESIZE), pygame.SRCALPHA)
+            grid.fill((0, 0, 255))
+            for r in range(self.ROWS):
+                for c in range(self.COLS):
+                    pygame.draw.circle(grid, (0, 0, 0, 0), (c * self.SQUARESIZE + self.SQUARESIZE // 2,
+                                                            r * self.SQUARESIZE + self.SQUARESIZE // 2), self.RADIUS)
+            grid = self.convert(grid)
+            self._grids[key] = grid
+        return grid
+
+    def sprite(self, color, radius=None):
+        """
+        Returns a piece sprite, rendered once per colour, radius and square size.
+
+        Parameters:
+        - color: The colour of the piece.
+        - radius: The radius of the piece (optional). Defaults to RADIUS.
+
+        Returns:
+        - A square transparent surface with the piece centered in it.
+        """
+        radius = self.RADIUS if radius is None else radius
+        key = (color, radius, self.SQUARESIZE)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = max(self.SQUARESIZE, 2 * radius + 2)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size // 2, size // 2), radius)
+            sprite = self.convert(sprite)
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw_piece(self, screen, color, center, radius=None):
+        """
+        Draws a piece sprite centered on a point.
+
+        Parameters:
+        - screen: The pygame screen surface where the piece will be drawn.
+        - color: The colour of the piece.
+        - center: The (x, y) center of the piece on the screen.
+        - radius: The radius of the piece (optional). Defaults to RADIUS.
+
+        Returns:
+        - The pygame.Rect of the screen area that was drawn.
+        """
+        sprite = self.sprite(color, radius)
+        size = sprite.get_width()
+        return screen.blit(sprite, (center[0] - size // 2, center[1] - size // 2))
+
+    def draw_column(self, screen, col, piece, center_y, hide_row=None):
+        """
+        Redraws one column, including the free row above the board, with a moving piece in it.
+
+        Parameters:
+        - screen: The pygame screen surface where the column will be drawn.
+        - col: The column to redraw.
+        - piece: The player's piece (1 or 2) that is moving.
+        - center_y: The vertical center of the moving piece on the screen.
+        - hide_row: A row of the column to draw as an empty hole (optional).
+
+        Returns:
+        - The pygame.Rect of the screen area that was drawn.
+        """
+        x = col * self.SQUARESIZE
+        area = pygame.Rect(x, 0, self.SQUARESIZE, (self.ROWS + 1) * self.SQUARESIZE)
+        screen.fill((0, 0, 0), (x, 0, self.SQUARESIZE, self.SQUARESIZE))
+        screen.blit(self.board_surface(), (x, self.SQUARESIZE), (x, 0, self.SQUARESIZE, self.ROWS * self.SQUARESIZE))
+        if hide_row is not None:
+            y = (hide_row + 1) * self.SQUARESIZE
+            screen.fill((0, 0, 0), (x, y, self.SQUARESIZE, self.SQUARESIZE))
+            screen.blit(self.grid_surface(), (x, y), (x, hide_row * self.SQUARESIZE, self.SQUARESIZE, self.SQUARESIZE))
+        self.draw_piece(screen, self.PIECE_COLORS[piece], (x + self.SQUARESIZE // 2, center_y))
+        return area
+
+    def draw_hint(self, screen, col=None, piece=None, label=None):
+        """
+        Redraws the free row above the board with a move hint, or clears it.
+
+        Parameters:
+        - screen: The pygame screen surface where the hint will be drawn.
+        - col: The hinted column (optional). The row is only cleared when omitted.
+        - piece: The piece (1 or 2) of the player the hint is for.
+        - label: A rendered text surface shown next to the marker (optional).
+
+        Returns:
+        - The pygame.Rect of the screen area that was drawn.
+        """
+        area = screen.fill((0, 0, 0), (0, 0, self.COLS * self.SQUARESIZE, self.SQUARESIZE))
+        if col is not None:
+            pygame.draw.circle(screen, self.PIECE_COLORS[piece],
+                               (col * self.SQUARESIZE + self.SQUARESIZE // 2, self.SQUARESIZE * 3 // 5),
+                               self.RADIUS // 2, 4)
+            if label is not None:
+                x = 10 if col >= self.COLS // 2 else self.COLS * self.SQUARESIZE - label.get_width() - 10
+                screen.blit(label, (x, 5))
+        return area
+
+    def drop_animation(self, screen, col, row, piece):
+        """
+        Animates the drop of a piece that has already been placed on the board.
+
+        Parameters:
+        - screen: The pygame screen surface where the animation will be drawn.
+        - col: The column where the piece was dropped.
+        - row: The row where the piece was placed.
+        - piece: The player's piece (1 or 2) that was dropped.
+
+        Yields:
+        - The number of milliseconds to show each frame for.
+        """
+        # Taller boards get shorter frames, so a drop takes about as long as on the standard board.
+        delay = max(5, 50 * Board.ROWS // self.ROWS)
+        for r in range(row + 1):
+            pygame.display.update(self.draw_column(screen, col, piece, r * self.SQUARESIZE + self.SQUARESIZE // 2,
+                                                   hide_row=row))
+            yield delay
+
+    def bounce_animation(self, screen, col, row, piece):
+        """
+        Animates a bounce effect when a piece is dropped.
+
+        Parameters:
+        - screen: The pygame screen surface where the animation will be drawn.
+        - col: The column where the piece was dropped.
+        - row: The row where the piece was placed.
+        - piece: The player's piece (1 or 2) that was placed.
+
+        Yields:
+        - The number of milliseconds to show each frame for.
+        """
+        for i in range(3):
+            pygame.display.update(self.draw_column(screen, col, piece, row * self.SQUARESIZE + self.SQUARESIZE // 2 - 10))
+            yield 100
+            pygame.display.update(self.draw_column(screen, col, piece, row * self.SQUARESIZE + self.SQUARESIZE // 2))
+            yield 100
@@ -1,5 +1,7 @@
 import pygame
 import sys
+from UI.assets import AssetManager
+from UI.main_loop import MainLoop
 
 
 class GameOver:
@@ -7,19 +9,28 @@ class GameOver:
     Class to handle the game over screen display and interactions.
     """
 
-    def __init__(self, screen, winner):
+    def __init__(self, screen, winner, loop=None, assets=None, scoreboard=None, players=("Player 1", "Player 2")):
         """
         Initializes the game over screen with the screen and winner information.
 
         Parameters:
         - screen: The pygame screen surface where the game over screen will be displayed.
         - winner: The player who won the game (1 or 2). If 0, it indicates a draw.
+        - loop: The MainLoop that paces the screen (optional). A new one is created if omitted.
+        - assets: The AssetManager to load images and text from (optional). A new one is created if omitted.
+        - scoreboard: The Scoreboard the result is recorded in (optional).
+        - players: The names of player 1 and player 2, as recorded in the scoreboard.
         """
         self.screen = screen
         self.winner = winner
-        self.background = pygame.image.load("assets/images/game over background.jpg")
-        self.background = pygame.transform.scale(self.background,
-                                                 (700, 600))  # Resize the background image to fit the screen size
+        self.loop = loop if loop is not None else MainLoop()
+        self.assets = assets if assets is not None else AssetManager()
+        self.background = self.assets.image("assets/images/game over background.jpg",
+                                            (700, 600))  # Resize the background image to fit the screen size
+        self.scoreboard = scoreboard
+        self.players = players
+        if scoreboard is not None:
+            scoreboard.record(players[0], players[1], winner)
 
     def display_game_over(self):
         """
@@ -33,23 +44,30 @@ class GameOver:
         self.screen.blit(self.background,
                          (0, 50))  # Display the background image with a padding of 50 pixels from the top
 
-        font = pygame.font.Font(None, 74)
         if self.winner == 0:
-            text = font.render("Draw!", True, (255, 255, 255))
+            text = self.assets.text("Draw!", 74)
         else:
-            text = font.render(f"Player {self.winner} wins!", True, (255, 255, 255))
+            text = self.assets.text(f"Player {self.winner} wins!", 74)
         self.screen.blit(text, (200, 100))  # Center the text
 
-        font = pygame.font.Font(None, 36)
-        restart_text = font.render("Press Enter to Restart", True, (255, 255, 255))
-        quit_text = font.render("Press Esc to Quit", True, (255, 255, 255))
+        if self.scoreboard is not None:
+            for i, name in enumerate(self.players):
+                totals = self.scoreboard.player(name)
+                # The totals change every game, so they are rendered afresh instead of cached by assets.text.
+                score_text = self.assets.font(36).render(
+                    f"{name}: {totals['wins']} W / {totals['losses']} L / {totals['draws']} D", True,
+                    (255, 255, 255))
+                self.screen.blit(score_text, (200, 180 + i * 40))  # List the totals below the result
+
+        restart_text = self.assets.text("Press Enter to Restart", 36)
+        quit_text = self.assets.text("Press Esc to Quit", 36)
         self.screen.blit(restart_text, (200, 550))  # Center the restart text below "Game Over"
         self.screen.blit(quit_text, (200, 500))  # Center the quit text below the restart text
 
         pygame.display.flip()
 
         while True:
-            for event in pygame.event.get():
+            for event in self.loop.next_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -58,4 +76,3 @@ class GameOver:
                         return True
                     elif event.key == pygame.K_ESCAPE:
                         return False
-            pygame.time.wait(10)
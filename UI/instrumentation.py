@@ -0,0 +1,230 @@
+import cProfile
+import csv
+import json
+import os
+import pstats
+import signal
+import time
+import pygame
+from UI.animation import Animator
+from UI.assets import AssetManager
+from UI.board_view import BoardView
+from UI.main_loop import MainLoop
+
+
+ENV_VAR = "CONNECT4_PROFILE"
+# Upper bounds, in milliseconds, of the frame time histogram buckets. Longer frames go in a last bucket.
+FRAME_BUCKETS = (1, 2, 4, 8, 16, 33, 50, 100, 250)
+
+
+class Instrumentation:
+    """
+    Class that measures where the game spends its time.
+
+    Nothing is measured until install() is called: it wraps the hot functions
+    (the event wait, the BoardView drawing methods, pygame.display.update and
+    flip, the animator and the asset loaders) with timers, and uninstall() puts the
+    originals back, so a game without instrumentation runs the plain code.
+
+    Every frame, the time spent outside the event wait is added to a
+    histogram. The counters are dumped to a JSON file (or appended to a CSV
+    file) every interval seconds. Pressing F9, or sending SIGUSR1, starts a
+    cProfile run of the game loop, and the next press writes it to disk.
+    """
+
+    def __init__(self, path, interval=10.0, profile_dir="."):
+        """
+        Initializes empty counters.
+
+        Parameters:
+        - path: The file the counters are dumped to. A .csv path appends one row per phase and per
+          histogram bucket per dump, any other path is overwritten with a JSON document.
+        - interval: The time between two dumps, in seconds.
+        - profile_dir: The directory cProfile snapshots are written to.
+        """
+        self.path = path
+        self.interval = interval
+        self.profile_dir = profile_dir
+        self.phases = {}
+        self.histogram = [0] * (len(FRAME_BUCKETS) + 1)
+        self.frames = 0
+        self.started = time.time()
+        self.next_dump = time.perf_counter() + interval
+        self.work_start = time.perf_counter()
+        self.patched = []
+        self.active = set()
+        self.profiler = None
+        self.profile_requested = False
+
+    def install(self):
+        """
+        Wraps the measured functions and the SIGUSR1 handler.
+        """
+        self.wrap(pygame.display, "update", "display_update")
+        self.wrap(pygame.display, "flip", "display_flip")
+        # The animations draw through draw_column and draw_piece rather than draw.
+        for method in ("draw", "draw_column", "draw_piece", "draw_hint"):
+            self.wrap(BoardView, method, "board_draw")
+        self.wrap(Animator, "update", "animation")
+        for method in ("image", "font", "text", "sound"):
+            self.wrap(AssetManager, method, "assets")
+        original = MainLoop.next_events
+
+        def next_events(loop, active=False):
+            self.frame(time.perf_counter() - self.work_start)
+            start = time.perf_counter()
+            events = original(loop, active)
+            self.work_start = time.perf_counter()
+            self.add("wait", self.work_start - start)
+            for event in events:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                    self.profile_requested = True
+            if self.profile_requested:
+                self.profile_requested = False
+                self.toggle_profile()
+            return events
+        self.patched.append((MainLoop, "next_events", original))
+        MainLoop.next_events = next_events
+        if hasattr(signal, "SIGUSR1"):
+            self.patched.append((signal, "SIGUSR1", signal.signal(signal.SIGUSR1, self.request_profile)))
+
+    def uninstall(self):
+        """
+        Restores the original functions and writes a last dump.
+        """
+        if self.profiler is not None:
+            self.toggle_profile()
+        for owner, name, original in reversed(self.patched):
+            if owner is signal:
+                signal.signal(signal.SIGUSR1, original)
+            else:
+                setattr(owner, name, original)
+        self.patched = []
+        self.dump()
+
+    def wrap(self, owner, name, phase):
+        """
+        Replaces a function or method with a version that times every call. A call
+        made while the same phase is already being timed, such as draw_column
+        calling draw_piece, counts as part of the outer call only.
+
+        Parameters:
+        - owner: The module, class or object holding the function.
+        - name: The attribute name of the function.
+        - phase: The phase the time is counted under.
+        """
+        original = getattr(owner, name)
+
+        def timed(*args, **kwargs):
+            if phase in self.active:
+                return original(*args, **kwargs)
+            self.active.add(phase)
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.add(phase, time.perf_counter() - start)
+                self.active.discard(phase)
+        timed.__doc__ = original.__doc__
+        self.patched.append((owner, name, original))
+        setattr(owner, name, timed)
+
+    def add(self, phase, seconds):
+        """
+        Counts one call of a phase.
+
+        Parameters:
+        - phase: The phase name.
+        - seconds: The duration of the call.
+        """
+        totals = self.phases.get(phase)
+        if totals is None:
+            totals = self.phases[phase] = [0, 0.0, 0.0]
+        totals[0] += 1
+        totals[1] += seconds
+        if seconds > totals[2]:
+            totals[2] = seconds
+
+    def frame(self, seconds):
+        """
+        Adds a frame's work time to the histogram and dumps the counters when due.
+
+        Parameters:
+        - seconds: The time spent handling the frame, not counting the event wait.
+        """
+        ms = seconds * 1000
+        bucket = 0
+        while bucket < len(FRAME_BUCKETS) and ms > FRAME_BUCKETS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        self.frames += 1
+        if time.perf_counter() >= self.next_dump:
+            self.dump()
+            self.next_dump = time.perf_counter() + self.interval
+
+    def snapshot(self):
+        """
+        Returns:
+        - A dict with the frame count, the frame time histogram and, per phase,
+          the number of calls, the total time and the longest call.
+        """
+        labels = [f"<={bound}ms" for bound in FRAME_BUCKETS] + [f">{FRAME_BUCKETS[-1]}ms"]
+        return {
+            "time": time.time(),
+            "uptime_seconds": time.time() - self.started,
+            "frames": self.frames,
+            "frame_histogram": dict(zip(labels, self.histogram)),
+            "phases": {phase: {"calls": calls, "seconds": seconds, "max_ms": longest * 1000}
+                       for phase, (calls, seconds, longest) in sorted(self.phases.items())},
+        }
+
+    def dump(self):
+        """
+        Writes the counters to the dump file. In a CSV file, each histogram bucket
+        gets a row of its own, with phase "frame_histogram:<bucket>" and the
+        number of frames in the calls column.
+        """
+        snapshot = self.snapshot()
+        if self.path.endswith(".csv"):
+            new_file = not os.path.exists(self.path)
+            with open(self.path, "a", newline="") as dump_file:
+                writer = csv.writer(dump_file)
+                if new_file:
+                    writer.writerow(["time", "frames", "phase", "calls", "seconds", "max_ms"])
+                for phase, totals in snapshot["phases"].items():
+                    writer.writerow([f"{snapshot['time']:.0f}", snapshot["frames"], phase,
+                                     totals["calls"], f"{totals['seconds']:.6f}", f"{totals['max_ms']:.3f}"])
+                for bucket, count in snapshot["frame_histogram"].items():
+                    writer.writerow([f"{snapshot['time']:.0f}", snapshot["frames"], f"frame_histogram:{bucket}",
+                                     count, "", ""])
+        else:
+            temporary = self.path + ".tmp"
+            with open(temporary, "w") as dump_file:
+                json.dump(snapshot, dump_file, indent=2)
+            os.replace(temporary, self.path)
+
+    def request_profile(self, signum=None, frame=None):
+        """
+        Asks for a cProfile run to start or stop at the next frame. Used as the SIGUSR1 handler.
+        """
+        self.profile_requested = True
+
+    def toggle_profile(self):
+        """
+        Starts a cProfile run, or stops the current one and writes it to a .prof file.
+
+        Returns:
+        - The path of the written profile, or None if a run was started.
+        """
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+            print("Profiling started")
+            return None
+        self.profiler.disable()
+        path = os.path.join(self.profile_dir, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+        self.profiler.dump_stats(path)
+        pstats.Stats(self.profiler).sort_stats("cumulative").print_stats(15)
+        self.profiler = None
+        print(f"Profile written to {path}")
+        return path
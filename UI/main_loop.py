@@ -0,0 +1,70 @@
+import time
+import pygame
+
+
+class MainLoop:
+    """
+    Class that paces the event loops of the menu, game and game over screens.
+
+    While nothing is moving on screen, it blocks on pygame.event.wait so an
+    idle window uses no CPU. While something is animating, it caps the frame
+    rate with a pygame Clock. It also counts the time spent waiting (idle)
+    versus the time spent handling events and drawing (busy).
+    """
+
+    def __init__(self, fps=60, idle_timeout=500):
+        """
+        Initializes the loop driver.
+
+        Parameters:
+        - fps: The frame rate cap while animating.
+        - idle_timeout: The longest time, in milliseconds, to block while idle before returning with no events.
+        """
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        self.idle_seconds = 0.0
+        self.busy_seconds = 0.0
+        self.frames = 0
+        self.frame_time = 0.0
+        self._last = time.perf_counter()
+
+    def next_events(self, active=False):
+        """
+        Waits for the next frame, or for input when idle, and returns the pending events.
+
+        Parameters:
+        - active: True while something is animating or otherwise needs frames without input.
+
+        Returns:
+        - A list of pygame events, possibly empty.
+        """
+        start = time.perf_counter()
+        self.busy_seconds += start - self._last
+        if active:
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(self.idle_timeout)
+            events = pygame.event.get()
+            if event.type != pygame.NOEVENT:
+                events.insert(0, event)
+        now = time.perf_counter()
+        self.idle_seconds += now - start
+        self.frame_time = (now - self._last) * 1000
+        self._last = now
+        self.frames += 1
+        return events
+
+    def report(self):
+        """
+        Returns:
+        - A dict with the idle and busy time in seconds, the idle share and the number of frames.
+        """
+        total = self.idle_seconds + self.busy_seconds
+        return {
+            "idle_seconds": self.idle_seconds,
+            "busy_seconds": self.busy_seconds,
+            "idle_fraction": self.idle_seconds / total if total else 0.0,
+            "frames": self.frames,
+        }
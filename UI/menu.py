@@ -1,5 +1,7 @@
 import pygame
 import sys
+from UI.assets import AssetManager
+from UI.main_loop import MainLoop
 
 
 class Menu:
@@ -7,17 +9,20 @@ class Menu:
     Class to handle the game menu display and interactions.
     """
 
-    def __init__(self, screen):
+    def __init__(self, screen, loop=None, assets=None):
         """
         Initializes the menu with the screen and background image.
 
         Parameters:
         - screen: The pygame screen surface where the menu will be displayed.
+        - loop: The MainLoop that paces the menu (optional). A new one is created if omitted.
+        - assets: The AssetManager to load images and text from (optional). A new one is created if omitted.
         """
         self.screen = screen
-        self.background = pygame.image.load("assets/images/connect four template.jpeg")
-        self.background = pygame.transform.scale(self.background,
-                                                 (700, 600))  # Resize the background image to fit the screen size
+        self.loop = loop if loop is not None else MainLoop()
+        self.assets = assets if assets is not None else AssetManager()
+        self.background = self.assets.image("assets/images/connect four template.jpeg",
+                                            (700, 600))  # Resize the background image to fit the screen size
 
     def display_menu(self):
         """
@@ -30,18 +35,16 @@ class Menu:
         self.screen.blit(self.background,
                          (0, 50))  # Display the background image with a padding of 50 pixels from the top
 
-        font = pygame.font.Font(None, 74)
-        start_text = font.render("Press Enter to Start", True, (255, 255, 255))
+        start_text = self.assets.text("Press Enter to Start", 74)
         self.screen.blit(start_text, (150, 650))  # Position the text with a padding of 50 pixels from the bottom
 
         pygame.display.flip()
 
         while True:
-            for event in pygame.event.get():
+            for event in self.loop.next_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
                         return False
-            pygame.time.wait(10)
@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.connect_k import ConnectKBoard
+
+
+SIZES = [(6, 7), (12, 12), (20, 20), (30, 30), (40, 40), (50, 50)]
+
+
+def full_scan(board, piece):
+    """
+    Checks a whole board for K in a row, the way Board.winning_move scans every window.
+
+    Parameters:
+    - board: The ConnectKBoard to check.
+    - piece: The player's piece (1 or 2) to check.
+
+    Returns:
+    - True if the piece has K in a row, False otherwise.
+    """
+    grid = board.board
+    rows, cols, k = board.ROWS, board.COLS, board.K
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_r, end_c = r + (k - 1) * dr, c + (k - 1) * dc
+                if 0 <= end_r < rows and 0 <= end_c < cols and \
+                        all(grid[r + i * dr][c + i * dc] == piece for i in range(k)):
+                    return True
+    return False
+
+
+def best_of(repeat, setup, run):
+    """
+    Times a function several times and keeps the fastest run, which is the least disturbed by the rest of the system.
+
+    Parameters:
+    - repeat: The number of runs.
+    - setup: A function called untimed before each run.
+    - run: The function to time.
+
+    Returns:
+    - The time of the fastest run, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_moves(rows, cols, k, moves, seed, repeat=5):
+    """
+    Times playing random moves on a board, checking each of them for a win, and undoing them all.
+    Each is timed on its own, as the fastest of several runs.
+
+    Parameters:
+    - rows: The number of rows.
+    - cols: The number of columns.
+    - k: The number of pieces in a row needed to win.
+    - moves: The number of moves to play. Wins do not stop the game.
+    - seed: The seed of the random number generator.
+    - repeat: The number of runs each time is the best of.
+
+    Returns:
+    - A dict with the time per move (which includes the incremental win tracking),
+      per winning_cells check and per undo, in microseconds.
+    """
+    rng = random.Random(seed)
+    board = ConnectKBoard(rows, cols, k)
+    moves = min(moves, rows * cols)
+    columns = []
+    for _ in range(moves):
+        col = rng.choice(board.legal_moves())
+        board.play(col)
+        columns.append(col)
+    # Every piece is checked on the full board, where its lines are as long as they get.
+    cells = [(row, col, board.piece_at(row, col)) for row in range(rows) for col in range(cols)
+             if board.piece_at(row, col)]
+
+    def play():
+        for col in columns:
+            board.play(col)
+
+    def undo():
+        while board.moves:
+            board.undo()
+
+    def check():
+        for row, col, piece in cells:
+            board.winning_cells(row, col, piece)
+
+    check_time = best_of(repeat, lambda: None, check)
+    undo()
+    play_time = best_of(repeat, undo, play)
+    undo_time = best_of(repeat, play, undo)
+    return {"play_us": play_time / moves * 1e6, "winning_cells_us": check_time / moves * 1e6,
+            "undo_us": undo_time / moves * 1e6}
+
+
+def main(argv=None):
+    """
+    Shows that the cost of a move on a ConnectKBoard does not grow with the board,
+    while a full scan of the board does.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Connect-K board scaling benchmark")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--moves", type=int, default=2000,
+                        help="moves played per board size (capped by the number of cells)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs each time is the best of")
+    parser.add_argument("--output", default=None,
+                        help="file to write the JSON results to")
+    options = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'size':>7} {'play us':>9} {'check us':>9} {'undo us':>9} {'full scan us':>13}")
+    for rows, cols in SIZES:
+        result = time_moves(rows, cols, min(options.k, max(rows, cols)), options.moves, seed=rows * cols,
+                            repeat=options.repeat)
+        board = ConnectKBoard(rows, cols, min(options.k, max(rows, cols)))
+        rng = random.Random(1)
+        for _ in range(rows * cols // 2):
+            board.play(rng.choice(board.legal_moves()))
+        # No piece 3 is ever found, so every window is read, as when nobody has won yet.
+        result["full_scan_us"] = best_of(options.repeat, lambda: None, lambda: full_scan(board, 3)) * 1e6
+        results[f"{rows}x{cols}"] = result
+        print(f"{rows:>3}x{cols:<3} {result['play_us']:>9.2f} {result['winning_cells_us']:>9.2f} "
+              f"{result['undo_us']:>9.2f} {result['full_scan_us']:>13.0f}")
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump({"k": options.k, "results": results}, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
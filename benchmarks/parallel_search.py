@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.bitboard import BitBoard
+from Logic.negamax import NegamaxAI
+from Logic.parallel_search import ParallelNegamaxAI
+
+
+# Fixed test positions, given as the columns played from the empty board.
+POSITIONS = [
+    [],
+    [3, 3],
+    [3, 2, 4, 4],
+    [3, 3, 3, 3, 2, 4],
+    [2, 3, 4, 3, 3, 2, 1, 5],
+]
+
+
+def time_search(player, depth):
+    """
+    Times a fixed-depth search of every test position.
+
+    Parameters:
+    - player: The computer player to time.
+    - depth: The search depth.
+
+    Returns:
+    - A (seconds, nodes) tuple summed over the positions.
+    """
+    player.max_depth = depth
+    player.time_limit = float("inf")
+    seconds = nodes = 0
+    for moves in POSITIONS:
+        start = time.perf_counter()
+        player.choose_move(BitBoard.from_moves(moves))
+        seconds += time.perf_counter() - start
+        nodes += player.stats["nodes"]
+    return seconds, nodes
+
+
+def main(argv=None):
+    """
+    Compares the single-process search with the parallel search at increasing worker counts.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Parallel search speedup benchmark")
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args(argv)
+
+    base_seconds, base_nodes = time_search(NegamaxAI(), options.depth)
+    # Nodes searched relative to the serial search: the work lost to splitting it.
+    print(f"{'workers':>8} {'seconds':>10} {'nodes/s':>12} {'overhead':>9} {'speedup':>8}")
+    print(f"{'serial':>8} {base_seconds:>10.3f} {base_nodes / base_seconds:>12.0f} {1.0:>9.2f} {1.0:>8.2f}")
+
+    workers = 1
+    while workers <= options.max_workers:
+        with ParallelNegamaxAI(workers=workers) as player:
+            # Start the worker processes before timing.
+            player.max_depth = 1
+            player.choose_move(BitBoard())
+            seconds, nodes = time_search(player, options.depth)
+        print(f"{workers:>8} {seconds:>10.3f} {nodes / seconds:>12.0f} {nodes / base_nodes:>9.2f} "
+              f"{base_seconds / seconds:>8.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from Logic.board import Board
+from Logic.bitboard import BitBoard
+from Logic.negamax import NegamaxAI
+from Logic.mcts import MCTSAI
+from UI.board_view import BoardView
+from benchmarks.parallel_search import POSITIONS
+
+
+def random_positions(count, seed):
+    """
+    Plays random moves from the empty board to build test positions. Positions
+    that already hold four in a row are skipped.
+
+    Parameters:
+    - count: The number of positions.
+    - seed: The seed of the random number generator.
+
+    Returns:
+    - A list of Boards with 0 to 41 pieces each.
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board()
+        for _ in range(rng.randrange(Board.ROWS * Board.COLS)):
+            col = rng.choice(board.legal_moves())
+            row = board.play(col)
+            if board.winning_cells(row, col, board.board[row][col]):
+                board.undo()
+                break
+        positions.append(board)
+    return positions
+
+
+def measure(function, number, repeat):
+    """
+    Times a function the way timeit does: number calls per run, repeat runs.
+
+    Parameters:
+    - function: The function to time, called without arguments.
+    - number: The number of calls per run.
+    - repeat: The number of runs.
+
+    Returns:
+    - A dict with the best and median time per call, in microseconds.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        runs.append((time.perf_counter() - start) / number * 1e6)
+    return {"best_us": min(runs), "median_us": statistics.median(runs), "calls": number * repeat}
+
+
+def cycle(items):
+    """
+    Builds a function that returns the next item of a list on every call, starting over at the end.
+
+    Parameters:
+    - items: The list to walk through.
+
+    Returns:
+    - The function.
+    """
+    state = {"index": -1}
+
+    def next_item():
+        state["index"] = (state["index"] + 1) % len(items)
+        return items[state["index"]]
+    return next_item
+
+
+def bench_rules(scale):
+    """
+    Times the rule checks of Board and BitBoard on fixed random positions.
+
+    Parameters:
+    - scale: The multiplier applied to the number of calls.
+
+    Returns:
+    - A dict of results keyed by benchmark name.
+    """
+    positions = random_positions(200, seed=1)
+    bit_positions = [BitBoard.from_moves(board.moves) for board in positions]
+    number, repeat = 2000 * scale, 5
+    boards = cycle(positions)
+    bit_boards = cycle(bit_positions)
+    columns = cycle(list(range(Board.COLS)))
+    last_moves = cycle([(board, 2 - len(board.moves) % 2) for board in positions if board.moves])
+
+    def last_move_check():
+        board, piece = last_moves()
+        col = board.moves[-1]
+        return board.winning_cells(Board.ROWS - board.heights[col], col, piece)
+
+    return {
+        "board.winning_move": measure(lambda: boards().winning_move(1), number, repeat),
+        "board.winning_cells": measure(last_move_check, number, repeat),
+        "bitboard.winning_move": measure(lambda: bit_boards().winning_move(1), number, repeat),
+        "board.get_next_open_row": measure(
+            lambda: boards().get_next_open_row(columns()), number, repeat),
+        "board.is_draw": measure(lambda: boards().is_draw(), number, repeat),
+    }
+
+
+def random_games(board_class, games, seed):
+    """
+    Plays random games to the end, checking for a win after every move.
+
+    Parameters:
+    - board_class: Board or BitBoard.
+    - games: The number of games.
+    - seed: The seed of the random number generator.
+
+    Returns:
+    - The number of moves played.
+    """
+    rng = random.Random(seed)
+    moves = 0
+    for _ in range(games):
+        board = board_class()
+        while True:
+            col = rng.choice(board.legal_moves())
+            row = board.play(col)
+            moves += 1
+            if board.winning_cells(row, col, 2 - len(board.moves) % 2) or board.is_draw():
+                break
+    return moves
+
+
+def bench_games(scale):
+    """
+    Measures how many random games per second Board and BitBoard can play.
+
+    Parameters:
+    - scale: The multiplier applied to the number of games.
+
+    Returns:
+    - A dict of results keyed by benchmark name.
+    """
+    results = {}
+    for name, board_class in (("board", Board), ("bitboard", BitBoard)):
+        games = 500 * scale
+        start = time.perf_counter()
+        moves = random_games(board_class, games, seed=2)
+        seconds = time.perf_counter() - start
+        results[f"{name}.random_games"] = {"games_per_second": games / seconds,
+                                           "moves_per_second": moves / seconds, "games": games}
+    return results
+
+
+def bench_render(scale):
+    """
+    Times BoardView.draw and the display update under the current SDL video driver.
+
+    Parameters:
+    - scale: The multiplier applied to the number of frames.
+
+    Returns:
+    - A dict of results keyed by benchmark name.
+    """
+    pygame.display.init()
+    screen = pygame.display.set_mode((700, 700))
+    board = random_positions(1, seed=3)[0]
+    view = BoardView(board)
+    rng = random.Random(3)
+    number, repeat = 100 * scale, 5
+    results = {"view.draw": measure(lambda: view.draw(screen), number, repeat)}
+
+    def move_and_draw():
+        if board.is_draw() or len(board.moves) > 30:
+            while board.moves:
+                board.undo()
+        board.play(rng.choice(board.legal_moves()))
+        view.draw(screen)
+    results["view.draw_after_move"] = measure(move_and_draw, number, repeat)
+    results["view.draw_and_update"] = measure(lambda: pygame.display.update(view.draw(screen)), number, repeat)
+    results["video_driver"] = pygame.display.get_driver()
+    pygame.display.quit()
+    return results
+
+
+def bench_engines(scale):
+    """
+    Measures the search speed of the computer players on the fixed test positions.
+
+    Parameters:
+    - scale: The multiplier applied to the search effort.
+
+    Returns:
+    - A dict of results keyed by benchmark name.
+    """
+    results = {}
+    negamax = NegamaxAI(time_limit=float("inf"), max_depth=6 + scale)
+    seconds = nodes = 0
+    for moves in POSITIONS:
+        negamax.table.clear()
+        start = time.perf_counter()
+        negamax.choose_move(BitBoard.from_moves(moves))
+        seconds += time.perf_counter() - start
+        nodes += negamax.stats["nodes"]
+    results["negamax.search"] = {"nodes_per_second": nodes / seconds, "nodes": nodes,
+                                 "seconds": seconds, "depth": negamax.max_depth}
+
+    mcts = MCTSAI(time_limit=float("inf"), playouts=2000 * scale, seed=4)
+    seconds = playouts = 0
+    for moves in POSITIONS:
+        mcts.root = None
+        start = time.perf_counter()
+        mcts.choose_move(BitBoard.from_moves(moves))
+        seconds += time.perf_counter() - start
+        playouts += mcts.stats["playouts"]
+    results["mcts.search"] = {"playouts_per_second": playouts / seconds, "playouts": playouts, "seconds": seconds}
+    return results
+
+
+GROUPS = {"rules": bench_rules, "games": bench_games, "render": bench_render, "engines": bench_engines}
+
+
+def git_commit():
+    """
+    Returns:
+    - The current git commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """
+    Prints every timing next to the same timing in an earlier run.
+
+    Parameters:
+    - results: The results of this run.
+    - baseline: The results of the earlier run, as written by --output.
+    """
+    print(f"{'benchmark':<28} {'metric':<20} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, values in results.items():
+        old = baseline.get(name)
+        if not isinstance(values, dict) or not isinstance(old, dict):
+            continue
+        for metric in ("median_us", "games_per_second", "nodes_per_second", "playouts_per_second"):
+            if metric in values and metric in old:
+                change = values[metric] / old[metric] - 1
+                print(f"{name:<28} {metric:<20} {old[metric]:>12.2f} {values[metric]:>12.2f} {change:>+8.1%}")
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks and prints or writes the results as JSON.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Connect Four benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=sorted(GROUPS), default=sorted(GROUPS),
+                        help="benchmark groups to run")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="multiplier for the number of iterations")
+    parser.add_argument("--output", default=None,
+                        help="file to write the JSON results to (printed when omitted)")
+    parser.add_argument("--compare", default=None,
+                        help="JSON results of an earlier run to compare against")
+    options = parser.parse_args(argv)
+
+    results = {}
+    for group in options.only:
+        results.update(GROUPS[group](options.scale))
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pygame": pygame.version.ver,
+        "scale": options.scale,
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if options.compare:
+        with open(options.compare) as baseline:
+            compare(results, json.load(baseline)["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,186 @@
+import argparse
+import atexit
+import os
+import time
 import pygame
 from UI.menu import Menu
 from UI.game_over import GameOver
-from Logic.game_logic import GameLogic
+from Logic.game_logic import GameLogic, post_hint_event
+from Logic.board import Board
+from Logic.connect_k import ConnectKBoard
+from UI.main_loop import MainLoop
+from UI.assets import AssetManager
+from UI.instrumentation import ENV_VAR, Instrumentation
+from Logic.negamax import NegamaxAI
+from Logic.parallel_search import ParallelNegamaxAI
+from Logic.mcts import MCTSAI
+from Logic.opening_book import BookPlayer, OpeningBook
+from Logic.eval_cache import CachedPlayer, EvalCache
+from Logic.game_record import GameRecordWriter
+from Logic.scoreboard import Scoreboard
+from Logic.ponder import Ponderer, PonderingPlayer
 
-def main():
+
+def parse_args(argv=None):
+    """
+    Parses the command line options.
+
+    Parameters:
+    - argv: The list of arguments to parse (optional). Defaults to sys.argv.
+
+    Returns:
+    - The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Connect Four")
+    parser.add_argument("--rows", type=int, default=Board.ROWS,
+                        help=f"number of rows, up to {ConnectKBoard.MAX_SIZE}")
+    parser.add_argument("--cols", type=int, default=Board.COLS,
+                        help=f"number of columns, up to {ConnectKBoard.MAX_SIZE}")
+    parser.add_argument("--connect", type=int, default=4,
+                        help="number of pieces in a row needed to win")
+    parser.add_argument("--opponent", choices=("human", "negamax", "parallel", "mcts"), default="human",
+                        help="who plays the second player's pieces")
+    parser.add_argument("--ai-time", type=float, default=1.0,
+                        help="time budget for a computer move, in seconds")
+    parser.add_argument("--ai-workers", type=int, default=None,
+                        help="worker processes for the parallel search (defaults to the number of CPUs)")
+    parser.add_argument("--ai-playouts", type=int, default=None,
+                        help="maximum playouts per move for the Monte Carlo player")
+    parser.add_argument("--book", default=None,
+                        help="opening book file built by tools/build_opening_book.py")
+    parser.add_argument("--cache", default=None,
+                        help="SQLite file that keeps search results between runs")
+    parser.add_argument("--ponder", action="store_true",
+                        help="analyse the position while a human player thinks, show a best-move hint "
+                             "and let the computer answer from the analysis")
+    parser.add_argument("--record", default="records",
+                        help="directory of the binary game record logs (empty to disable, "
+                             "only standard games are recorded)")
+    parser.add_argument("--scores", default="high_score.txt",
+                        help="file that keeps the win, loss and draw totals (empty to disable)")
+    parser.add_argument("--profile", default=os.environ.get(ENV_VAR) or None,
+                        help=f"file to dump frame and phase timings to, as JSON or .csv (also set by {ENV_VAR}); "
+                             "F9 or SIGUSR1 starts and stops a cProfile capture")
+    parser.add_argument("--profile-interval", type=float, default=10.0,
+                        help="time between two timing dumps, in seconds")
+    parser.add_argument("--skip-animations", action="store_true",
+                        help="show moves at once, without drop and win animations")
+    options = parser.parse_args(argv)
+    if options.ai_playouts is not None and options.ai_playouts < 1:
+        parser.error("--ai-playouts must be at least 1")
+    if options.cache and options.opponent == "mcts":
+        parser.error("--cache keeps negamax search results and cannot be used with --opponent mcts")
+    options.standard = (options.rows, options.cols, options.connect) == (Board.ROWS, Board.COLS, 4)
+    if not options.standard:
+        try:
+            ConnectKBoard(options.rows, options.cols, options.connect)
+        except ValueError as error:
+            parser.error(str(error))
+        if options.opponent != "human" or options.ponder or options.book or options.cache:
+            parser.error("computer players, pondering, books and caches need the standard 6x7 connect-4 board")
+    return options
+
+
+def create_board(options):
+    """
+    Creates an empty board of the size selected on the command line.
+
+    Parameters:
+    - options: The parsed command line options.
+
+    Returns:
+    - A Board for the standard game, or a ConnectKBoard otherwise.
+    """
+    if options.standard:
+        return Board()
+    return ConnectKBoard(options.rows, options.cols, options.connect)
+
+
+def create_ai(options):
+    """
+    Creates the computer player selected on the command line.
+
+    Parameters:
+    - options: The parsed command line options.
+
+    Returns:
+    - The computer player, or None for a two-player game.
+    """
+    if options.opponent == "negamax":
+        ai = NegamaxAI(time_limit=options.ai_time)
+    elif options.opponent == "parallel":
+        ai = ParallelNegamaxAI(time_limit=options.ai_time, workers=options.ai_workers)
+    elif options.opponent == "mcts":
+        ai = MCTSAI(time_limit=options.ai_time, playouts=options.ai_playouts)
+    else:
+        return None
+    # The pondering search shares the negamax player's transposition table.
+    table = ai.table if isinstance(ai, NegamaxAI) else None
+    if options.cache:
+        ai = CachedPlayer(EvalCache(options.cache), ai)
+    if options.book:
+        ai = BookPlayer(OpeningBook(options.book), ai)
+    if options.ponder:
+        ai = PonderingPlayer(ai, Ponderer(table=table, on_update=post_hint_event))
+    return ai
+
+
+def main(argv=None):
     """
     Main function that initializes the game and handles the main game loop,
     switching between the menu and the game.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
     """
+    start = time.perf_counter()
+    options = parse_args(argv)
+    instrumentation = None
+    if options.profile:
+        instrumentation = Instrumentation(options.profile, options.profile_interval)
+        instrumentation.install()
+        atexit.register(instrumentation.uninstall)
     pygame.init()
     pygame.mixer.init()
     screen = pygame.display.set_mode((700, 700))
     pygame.display.set_caption("Connect Four")
-    clock = pygame.time.Clock()
+    loop = MainLoop()
+    assets = AssetManager()
 
-    try:
-        drop_sound = pygame.mixer.Sound("assets/sounds/drop.wav")
-        win_sound = pygame.mixer.Sound("assets/sounds/win.wav")
-    except pygame.error:
-        print("Sound file not found! Ensure 'drop.wav' and 'win.wav' are in 'assets/sounds' directory.")
-        drop_sound = None
-        win_sound = None
+    drop_sound = assets.sound("assets/sounds/drop.wav")
+    win_sound = assets.sound("assets/sounds/win.wav")
 
-    menu = Menu(screen)
+    menu = Menu(screen, loop, assets)
+    ai = create_ai(options)
+    if instrumentation is not None and ai is not None:
+        instrumentation.wrap(ai, "choose_move", "ai")
+    recorder = GameRecordWriter(options.record) if options.record and options.standard else None
+    if recorder is not None:
+        # Quitting from the game window exits without returning here.
+        atexit.register(recorder.close)
+    scoreboard = Scoreboard(options.scores) if options.scores else None
+    if scoreboard is not None:
+        atexit.register(scoreboard.close)
+    ponderer = None
+    if isinstance(ai, PonderingPlayer):
+        ponderer = ai.ponderer
+    elif options.ponder:
+        ponderer = Ponderer(on_update=post_hint_event)
+    players = ("Player 1", "Player 2" if options.opponent == "human" else options.opponent)
+    print(f"Started in {(time.perf_counter() - start) * 1000:.0f} ms")
+    restart_times = []
 
     while True:
         in_menu = True
         while in_menu:
             in_menu = menu.display_menu()
 
-        game = GameLogic(screen, drop_sound, win_sound)
+        game = GameLogic(screen, drop_sound, win_sound, ai=ai, skip_animations=options.skip_animations, loop=loop,
+                         recorder=recorder, ponderer=ponderer, assets=assets, board=create_board(options))
         winner = game.run_game()
-        game_over = GameOver(screen, winner)
+        start = time.perf_counter()
+        game_over = GameOver(screen, winner, loop, assets, scoreboard, players)
+        restart_times.append(time.perf_counter() - start)
         restart = game_over.display_game_over()
 
         if restart:
@@ -39,6 +188,22 @@ def main():
         else:
             break
 
+    if hasattr(ai, "close"):
+        ai.close()
+    elif ponderer is not None:
+        ponderer.close()
+    if recorder is not None:
+        recorder.close()
+    if scoreboard is not None:
+        scoreboard.close()
+    print(f"Game over screen built in {sum(restart_times) / len(restart_times) * 1000:.1f} ms on average, "
+          f"{assets.loads} assets loaded in {assets.load_seconds * 1000:.0f} ms, {assets.hits} cache hits")
+    report = loop.report()
+    print(f"Idle {report['idle_seconds']:.1f}s, busy {report['busy_seconds']:.1f}s "
+          f"({report['idle_fraction']:.0%} idle) over {report['frames']} frames")
+    if instrumentation is not None:
+        atexit.unregister(instrumentation.uninstall)
+        instrumentation.uninstall()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,290 @@
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.bitboard import BitBoard
+from Logic.mcts import MCTSAI
+from Logic.negamax import NegamaxAI
+
+
+_players = {}
+
+
+def ai_move(opponent, time_limit, moves):
+    """
+    Picks a computer move in an executor worker. One player per opponent kind is
+    kept per worker, so their tables and trees are reused between moves, and
+    the time budget is set on it for each move.
+
+    Parameters:
+    - opponent: "negamax" or "mcts".
+    - time_limit: The time budget for the move, in seconds.
+    - moves: The columns played so far.
+
+    Returns:
+    - The column to play.
+    """
+    player = _players.get(opponent)
+    if player is None:
+        player = NegamaxAI() if opponent == "negamax" else MCTSAI()
+        _players[opponent] = player
+    player.time_limit = time_limit
+    return player.choose_move(BitBoard.from_moves(moves))
+
+
+def read_rss():
+    """
+    Returns:
+    - The resident memory of the process in bytes, or 0 if it cannot be read.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class Match:
+    """
+    State of one match: the board, the connected players and the computer opponent.
+    """
+    __slots__ = ("id", "board", "players", "opponent", "time_limit")
+
+    def __init__(self, match_id, opponent, time_limit):
+        """
+        Initializes an empty match.
+
+        Parameters:
+        - match_id: The id of the match.
+        - opponent: "human", "random", "negamax" or "mcts". A computer opponent plays piece 2.
+        - time_limit: The computer opponent's time budget per move, in seconds.
+        """
+        self.id = match_id
+        self.board = BitBoard()
+        self.players = {}
+        self.opponent = opponent
+        self.time_limit = time_limit
+
+
+class GameServer:
+    """
+    Class that hosts many concurrent matches over newline-delimited JSON on TCP.
+
+    Client messages:
+    - {"type": "new", "opponent": "human" | "random" | "negamax" | "mcts", "time": seconds}
+      (the time is capped at max_time)
+    - {"type": "join", "match": id}
+    - {"type": "move", "match": id, "col": column}
+    - {"type": "stats"} (the reply carries "traced" bytes when the server runs with --trace-memory)
+
+    Moves are broadcast to every player of the match as {"type": "moved", ...}.
+    The move that ends the game also carries "winner": 1, 2, or 0 for a draw. Computer
+    moves run in an executor so the event loop never blocks on a search.
+    """
+    OPPONENTS = ("human", "random", "negamax", "mcts")
+
+    def __init__(self, executor=None, max_time=1.0):
+        """
+        Initializes the server.
+
+        Parameters:
+        - executor: The executor used for computer moves (optional). Defaults to a process pool.
+        - max_time: The largest time budget per computer move a client may ask for, in seconds.
+        """
+        self.executor = executor if executor is not None else ProcessPoolExecutor()
+        self.max_time = max_time
+        self.matches = {}
+        self.ids = itertools.count(1)
+        self.finished = 0
+
+    async def serve(self, host, port):
+        """
+        Accepts connections until cancelled.
+
+        Parameters:
+        - host: The address to listen on.
+        - port: The port to listen on.
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle(self, reader, writer):
+        """
+        Serves one client connection.
+
+        Parameters:
+        - reader: The connection's StreamReader.
+        - writer: The connection's StreamWriter.
+        """
+        joined = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    reply = await self.dispatch(message, writer, joined)
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"type": "error", "error": str(error)}
+                if reply is not None:
+                    self.send(writer, reply)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for match_id in joined:
+                match = self.matches.get(match_id)
+                if match is not None:
+                    match.players = {piece: player for piece, player in match.players.items() if player is not writer}
+                    if not match.players:
+                        del self.matches[match_id]
+            writer.close()
+
+    async def dispatch(self, message, writer, joined):
+        """
+        Handles one client message.
+
+        Parameters:
+        - message: The decoded message.
+        - writer: The StreamWriter of the client that sent it.
+        - joined: The ids of the matches this client plays in.
+
+        Returns:
+        - The reply to send to the client, or None if the reply was broadcast.
+        """
+        kind = message["type"]
+        if kind == "new":
+            opponent = message.get("opponent", "human")
+            if opponent not in self.OPPONENTS:
+                raise ValueError(f"unknown opponent {opponent!r}")
+            time_limit = float(message.get("time", 0.1))
+            if not math.isfinite(time_limit) or time_limit <= 0:
+                raise ValueError(f"bad time {time_limit!r}")
+            match = Match(next(self.ids), opponent, min(time_limit, self.max_time))
+            match.players[1] = writer
+            self.matches[match.id] = match
+            joined.add(match.id)
+            return {"type": "started", "match": match.id, "piece": 1}
+        if kind == "join":
+            match = self.matches[message["match"]]
+            if match.opponent != "human" or 2 in match.players:
+                raise ValueError("match is full")
+            match.players[2] = writer
+            joined.add(match.id)
+            return {"type": "started", "match": match.id, "piece": 2}
+        if kind == "move":
+            match = self.matches[message["match"]]
+            piece = match.board.current_piece()
+            if match.players.get(piece) is not writer:
+                raise ValueError("not your turn")
+            if not await self.play(match, int(message["col"])):
+                raise ValueError("column is full")
+            return None
+        if kind == "stats":
+            stats = {"type": "stats", "matches": len(self.matches), "finished": self.finished, "rss": read_rss()}
+            if tracemalloc.is_tracing():
+                stats["traced"] = tracemalloc.get_traced_memory()[0]
+            return stats
+        raise ValueError(f"unknown message type {kind!r}")
+
+    async def play(self, match, col):
+        """
+        Plays a move, broadcasts it, and lets the computer opponent answer.
+
+        Parameters:
+        - match: The Match to play in.
+        - col: The column to play.
+
+        Returns:
+        - False if the column is not a legal move, True otherwise.
+        """
+        board = match.board
+        if not 0 <= col < BitBoard.COLS or not board.is_valid_location(col):
+            return False
+        while True:
+            piece = board.current_piece()
+            row = board.play(col)
+            message = {"type": "moved", "match": match.id, "col": col, "row": row, "piece": piece}
+            won = board.winning_cells(row, col, piece)
+            if won or board.is_draw():
+                message["winner"] = piece if won else 0
+            self.broadcast(match, message)
+            if "winner" in message:
+                self.matches.pop(match.id, None)
+                self.finished += 1
+                return True
+            if match.opponent == "human" or board.current_piece() != 2:
+                return True
+            if match.opponent == "random":
+                col = random.choice(board.legal_moves())
+            else:
+                col = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, ai_move, match.opponent, match.time_limit, list(board.moves))
+
+    def broadcast(self, match, message):
+        """
+        Sends a message to every player of a match.
+
+        Parameters:
+        - match: The Match whose players receive the message.
+        - message: The message to send.
+        """
+        for writer in set(match.players.values()):
+            self.send(writer, message)
+
+    @staticmethod
+    def send(writer, message):
+        """
+        Queues a message on a connection.
+
+        Parameters:
+        - writer: The StreamWriter to send on.
+        - message: The message to send.
+        """
+        if not writer.is_closing():
+            writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+def main(argv=None):
+    """
+    Runs the game server from the command line.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Connect Four match server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes for computer moves (defaults to the number of CPUs)")
+    parser.add_argument("--max-time", type=float, default=1.0,
+                        help="largest computer time per move a client may ask for, in seconds")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="trace Python allocations so stats report the exact memory in use (slower)")
+    options = parser.parse_args(argv)
+
+    if options.trace_memory:
+        tracemalloc.start()
+    server = GameServer(ProcessPoolExecutor(max_workers=options.workers), options.max_time)
+    print(f"Serving on {options.host}:{options.port}")
+    try:
+        asyncio.run(server.serve(options.host, options.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+
+class Connection:
+    """
+    Client connection to the game server speaking newline-delimited JSON.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Wraps an open connection.
+
+        Parameters:
+        - reader: The connection's StreamReader.
+        - writer: The connection's StreamWriter.
+        """
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host, port):
+        """
+        Connects to the server.
+
+        Parameters:
+        - host: The server address.
+        - port: The server port.
+
+        Returns:
+        - A new Connection.
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send(self, message):
+        """
+        Sends a message.
+
+        Parameters:
+        - message: The message to send.
+        """
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self):
+        """
+        Returns:
+        - The next message from the server.
+        """
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        message = json.loads(line)
+        if message["type"] == "error":
+            raise RuntimeError(message["error"])
+        return message
+
+    async def close(self):
+        """
+        Closes the connection.
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_matches(host, port, matches, opponent, time_limit, latencies):
+    """
+    Plays matches one after the other against the server's computer opponent, picking random moves.
+
+    Parameters:
+    - host: The server address.
+    - port: The server port.
+    - matches: The number of matches to play.
+    - opponent: The server-side opponent.
+    - time_limit: The opponent's time budget per move, in seconds.
+    - latencies: A list that receives, for every move, the time until the computer's answer
+      (or the end of the game) arrives, in seconds.
+    """
+    connection = await Connection.open(host, port)
+    for _ in range(matches):
+        await connection.send({"type": "new", "opponent": opponent, "time": time_limit})
+        match_id = (await connection.receive())["match"]
+        heights = [0] * 7
+        over = False
+        while not over:
+            col = random.choice([c for c in range(7) if heights[c] < 6])
+            sent = time.perf_counter()
+            await connection.send({"type": "move", "match": match_id, "col": col})
+            while True:
+                message = await connection.receive()
+                heights[message["col"]] += 1
+                if "winner" in message:
+                    over = True
+                if over or message["piece"] == 2:
+                    latencies.append(time.perf_counter() - sent)
+                    break
+    await connection.close()
+
+
+async def measure_memory(host, port, matches):
+    """
+    Opens many idle matches and measures how much the server's memory grows. The
+    server's traced Python allocations are used when it runs with --trace-memory;
+    otherwise the resident memory is used, which only grows by whole pages and
+    needs many matches to mean anything.
+
+    Parameters:
+    - host: The server address.
+    - port: The server port.
+    - matches: The number of matches to open.
+
+    Returns:
+    - A (bytes, source) tuple: the server memory growth per open match and "traced" or "rss".
+    """
+    connection = await Connection.open(host, port)
+    await connection.send({"type": "stats"})
+    before = await connection.receive()
+    source = "traced" if "traced" in before else "rss"
+    for _ in range(matches):
+        await connection.send({"type": "new", "opponent": "random"})
+        await connection.receive()
+    await connection.send({"type": "stats"})
+    after = await connection.receive()
+    await connection.close()
+    return (after[source] - before[source]) / matches, source
+
+
+async def run(options):
+    """
+    Runs the load test and prints the results.
+
+    Parameters:
+    - options: The parsed command line options.
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(play_matches(options.host, options.port, options.matches, options.opponent,
+                                        options.time, latencies) for _ in range(options.clients)))
+    elapsed = time.perf_counter() - start
+    total = options.clients * options.matches
+    latencies.sort()
+    print(f"{total} matches in {elapsed:.2f}s: {total / elapsed:.1f} matches/s, {len(latencies) / elapsed:.0f} moves/s")
+    print(f"Move to answer: median {statistics.median(latencies) * 1000:.2f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+    per_match, source = await measure_memory(options.host, options.port, options.memory_matches)
+    if source == "traced":
+        print(f"Server memory: {per_match:.0f} bytes per open match (traced allocations)")
+    else:
+        print(f"Server memory: {per_match:.0f} bytes per open match (resident memory, page-granular; "
+              f"run the server with --trace-memory for an exact figure)")
+
+
+def main(argv=None):
+    """
+    Runs the load generator from the command line.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Headless load generator for the Connect Four server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50, help="concurrent connections")
+    parser.add_argument("--matches", type=int, default=20, help="matches played by each connection")
+    parser.add_argument("--opponent", default="random", choices=("random", "negamax", "mcts"))
+    parser.add_argument("--time", type=float, default=0.01, help="computer opponent time per move, in seconds")
+    parser.add_argument("--memory-matches", type=int, default=10000,
+                        help="idle matches opened to measure memory per match")
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+from Logic.bitboard import BitBoard
+from Logic.eval_cache import CachedPlayer, EvalCache
+from Logic.negamax import NegamaxAI
+
+
+class CachedPlayerTest(unittest.TestCase):
+    """
+    Checks which cached evaluations the CachedPlayer trusts.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = EvalCache(os.path.join(self.directory.name, "cache.db"))
+        self.player = CachedPlayer(self.cache, NegamaxAI(time_limit=0.05))
+
+    def tearDown(self):
+        self.player.close()
+        self.directory.cleanup()
+
+    def test_shallow_entry_is_rejected_after_a_win(self):
+        # The immediate win ends the search at depth 1 without running out of time.
+        self.assertEqual(self.player.choose_move(BitBoard.from_moves([0, 6, 0, 6, 0, 6])), 0)
+        self.assertFalse(self.player.stats["timed_out"])
+        self.cache.put(BitBoard.from_moves([3, 3]).key(), 7, 1, 0)
+        self.player.choose_move(BitBoard.from_moves([3, 3]))
+        self.assertFalse(self.player.stats["cached"])
+
+    def test_entry_as_deep_as_the_budget_is_used(self):
+        self.player.choose_move(BitBoard.from_moves([3, 3]))
+        self.assertTrue(self.player.stats["timed_out"])
+        depth = self.player.stats["depth"]
+        self.player.choose_move(BitBoard.from_moves([3, 3, 0, 6, 0, 6, 0, 6]))
+        self.cache.put(BitBoard.from_moves([3, 3, 2, 2]).key(), 7, depth, 0)
+        self.assertEqual(self.player.choose_move(BitBoard.from_moves([3, 3, 2, 2])), 0)
+        self.assertTrue(self.player.stats["cached"])
+
+
+if __name__ == "__main__":
+    unittest.main()
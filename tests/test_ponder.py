@@ -0,0 +1,51 @@
+import unittest
+from Logic.bitboard import BitBoard
+from Logic.negamax import NegamaxAI
+from Logic.ponder import Ponderer, PonderingPlayer
+
+
+class PonderingPlayerTest(unittest.TestCase):
+    """
+    Checks which pondered answers the PonderingPlayer trusts.
+    """
+
+    def setUp(self):
+        self.ponderer = Ponderer()
+        self.player = PonderingPlayer(NegamaxAI(time_limit=0.05), self.ponderer)
+        self.player.new_game()
+
+    def tearDown(self):
+        self.player.close()
+
+    def ponder_result(self, moves, depth, score, move):
+        """
+        Stores an analysis as if the Ponderer had searched the position.
+        """
+        with self.ponderer.condition:
+            self.ponderer.results[tuple(moves)] = (depth, score, move)
+
+    def test_shallow_analysis_is_rejected_after_a_win(self):
+        # The immediate win ends the search at depth 1 without running out of time.
+        self.assertEqual(self.player.choose_move(BitBoard.from_moves([0, 6, 0, 6, 0, 6])), 0)
+        self.assertFalse(self.player.stats["timed_out"])
+        self.player.new_game()
+        self.ponder_result([3, 3], 3, 7, 0)
+        self.player.choose_move(BitBoard.from_moves([3, 3]))
+        self.assertFalse(self.player.stats["pondered"])
+
+    def test_analysis_as_deep_as_the_budget_is_used(self):
+        self.player.choose_move(BitBoard.from_moves([3, 3]))
+        self.assertTrue(self.player.stats["timed_out"])
+        depth = self.player.stats["depth"]
+        # A forced win in the same game does not lower the depth needed.
+        self.player.choose_move(BitBoard.from_moves([3, 3, 0, 6, 0, 6, 0, 6]))
+        self.ponder_result([3, 3, 2, 2], depth, 7, 0)
+        self.assertEqual(self.player.choose_move(BitBoard.from_moves([3, 3, 2, 2])), 0)
+        self.assertTrue(self.player.stats["pondered"])
+        self.player.new_game()
+        self.player.choose_move(BitBoard.from_moves([3, 3, 2, 2]))
+        self.assertFalse(self.player.stats["pondered"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.bitboard import BitBoard
+from Logic.opening_book import build_book, OpeningBook
+
+
+def main(argv=None):
+    """
+    Builds an opening book file from the command line.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Build a Connect Four opening book")
+    parser.add_argument("path", help="the book file to write")
+    parser.add_argument("--plies", type=int, default=6,
+                        help="deepest position stored, in moves from the empty board")
+    parser.add_argument("--search-depth", type=int, default=8,
+                        help="negamax depth used to evaluate each position")
+    options = parser.parse_args(argv)
+
+    start = time.perf_counter()
+
+    def progress(count):
+        if count % 1000 == 0:
+            print(f"{count} positions, {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    count = build_book(options.path, options.plies, options.search_depth, progress)
+    print(f"Wrote {count} positions to {options.path} in {time.perf_counter() - start:.1f}s")
+
+    book = OpeningBook(options.path)
+    start = time.perf_counter()
+    board = BitBoard.from_moves([3, 3])
+    for _ in range(10000):
+        book.lookup(board)
+    print(f"Lookup: {(time.perf_counter() - start) / 10000 * 1e6:.1f} us")
+    book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.tournament import parse_player, run_tournament, schedule
+
+
+def print_standings(table):
+    """
+    Prints the current ratings, best first.
+
+    Parameters:
+    - table: The EloTable of the tournament.
+    """
+    print(f"{'player':<16} {'elo':>7} {'95% ci':>8} {'wins':>6} {'draws':>6} {'losses':>6}")
+    for name, elo, interval, wins, draws, losses in table.standings():
+        print(f"{name:<16} {elo:>7.0f} {interval:>8.0f} {wins:>6} {draws:>6} {losses:>6}")
+
+
+def main(argv=None):
+    """
+    Runs a tournament between computer player configurations from the command line.
+
+    Parameters:
+    - argv: The command line arguments (optional). Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Connect Four engine tournament",
+        epilog="example: --player fast=negamax:time=0.05 --player deep=negamax:time=0.2 "
+               "--player uct=mcts:time=0.1 --player rnd=random")
+    parser.add_argument("--player", action="append", required=True,
+                        help="a player configuration, name=engine[:key=value,...]; repeat for each player")
+    parser.add_argument("--mode", choices=("round-robin", "gauntlet"), default="round-robin",
+                        help="every pair plays, or only the first player against each other one")
+    parser.add_argument("--rounds", type=int, default=10,
+                        help="openings per pairing; each opening is played with both colours")
+    parser.add_argument("--opening-plies", type=int, default=2,
+                        help="random moves played before the players take over")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed the openings are drawn from")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (defaults to the number of CPUs)")
+    parser.add_argument("--results", default="tournament.jsonl",
+                        help="JSON lines file the results are appended to; an existing file is resumed")
+    parser.add_argument("--report-every", type=int, default=20,
+                        help="print the standings every this many games")
+    options = parser.parse_args(argv)
+
+    try:
+        players = dict(parse_player(spec) for spec in options.player)
+    except ValueError as error:
+        parser.error(str(error))
+    if len(players) < 2:
+        parser.error("a tournament needs at least two players")
+
+    total = len(schedule(list(players), options.mode, options.rounds, options.opening_plies, options.seed))
+    start = time.perf_counter()
+    played = [0]
+
+    def on_game(game, table):
+        played[0] += 1
+        if played[0] % options.report_every == 0:
+            elapsed = time.perf_counter() - start
+            print(f"\n{played[0]} games this run ({played[0] / elapsed:.1f} games/s), "
+                  f"game {game['id'] + 1} of {total}")
+            print_standings(table)
+
+    try:
+        table = run_tournament(players, options.results, options.mode, options.rounds, options.opening_plies,
+                               options.seed, options.workers, on_game)
+    except ValueError as error:
+        parser.error(str(error))
+    except KeyboardInterrupt:
+        print(f"\nStopped after {played[0]} games; run the same command again to resume.")
+        return
+    elapsed = time.perf_counter() - start
+    print(f"\nFinished: {played[0]} games played in {elapsed:.1f}s")
+    print_standings(table)
+
+
+if __name__ == "__main__":
+    main()